@@ -10,16 +10,45 @@ Follows SOLID principles:
 - Services are injected as dependencies
 
 Usage:
-    python app.py
+    python app.py          # Development server
+    gunicorn app:app       # Production (see gunicorn.conf.py)
 """
 
 import logging
-from flask import Flask, request, jsonify, send_from_directory
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+from flask import Flask, abort, request, jsonify, send_file
+from flask_compress import Compress
 from flask_cors import CORS
-
-from config import config
-from services.image_service import ImageGenerationService
+from werkzeug.exceptions import HTTPException
+from werkzeug.security import safe_join
+
+from config import (
+    config,
+    GENERATION_CACHE_TTL,
+    HEALTH_CACHE_SECONDS,
+    HEALTH_CHECK_TIMEOUT,
+    MAX_BATCH_SIZE,
+    STATIC_MAX_AGE
+)
+from services.image_service import (
+    IMAGE_FORMATS,
+    ImageGenerationService,
+    current_timestamp
+)
 from services.model_service import ModelService
+from utils.cache import (
+    init_cache,
+    make_generation_key,
+    get_cached_generation,
+    set_cached_generation
+)
+from utils.json_provider import OrjsonProvider
+from utils.validators import validate_negative_prompt, validate_prompt
 
 
 # Configure logging
@@ -30,30 +59,199 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Absolute path to the frontend, resolved once at startup
+# Relative to this file, so the server can be started from any directory
+FRONTEND_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'frontend')
+)
+
+
 # Initialize Flask application
-app = Flask(__name__, static_folder='../frontend')
+# Without SERVE_FRONTEND, Flask's built-in /frontend/<path> static route is
+# not registered either, so only Nginx serves the frontend files
+app = Flask(
+    __name__,
+    static_folder=FRONTEND_DIR if config.SERVE_FRONTEND else None
+)
+
+# Serialize all JSON responses with orjson instead of the stdlib json module
+# The base64 image in /api/generate makes encoding a large part of each response
+app.json_provider_class = OrjsonProvider
+app.json = OrjsonProvider(app)
+
+# Never pretty-print or sort keys, even in debug mode
+# Both walk the whole response and pretty-printing adds bytes on the wire
+app.json.compact = True
+app.json.sort_keys = False
+
+# Compress JSON responses (brotli preferred, gzip fallback)
+# Level 4 keeps CPU cost low at high request rates; tiny bodies are skipped
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
 
 # Enable CORS to allow frontend to communicate with backend
 # In production, you should restrict this to your frontend domain
 CORS(app)
 
 
+# ============================================================================
+# API Errors
+# ============================================================================
+
+class APIError(Exception):
+    """
+    Error raised by routes to return a JSON error response.
+    
+    The registered error handler turns it into
+    {"success": false, "error": message} with the given status code.
+    
+    Attributes:
+        status (int): HTTP status code for the response
+    
+    Example:
+        raise APIError('Prompt is required')
+        raise APIError("Model 'x' not found", 404)
+    """
+    
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
 # Initialize services with dependency injection
 # These are created once when the app starts
 try:
     image_service = ImageGenerationService(api_key=config.HF_TOKEN)
     model_service = ModelService()
+    model_service.warmup()
+    init_cache(config.REDIS_URL)
     logger.info("Services initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize services: {str(e)}")
     raise
 
 
+# Health check state
+# The HuggingFace probe runs on a background thread and its result is
+# reused for a few seconds, so /api/health never hangs on a dead upstream
+_health_executor = ThreadPoolExecutor(max_workers=1)
+_health_lock = threading.Lock()
+_health_state = {
+    'huggingface': 'unknown',
+    'checked_at': float('-inf'),
+    'probe': None
+}
+
+
+# ============================================================================
+# Pre-serialized Model Catalog
+# ============================================================================
+
+def _models_query_key(
+    category: Optional[str],
+    tag: Optional[str],
+    ui_mode: bool
+) -> Tuple[str, ...]:
+    """
+    Normalize /api/models query parameters into a lookup key.
+    
+    Responsibility: ONLY map query parameters to a key
+    
+    Args:
+        category (Optional[str]): Category filter
+        tag (Optional[str]): Tag filter
+        ui_mode (bool): Whether the UI projection was requested
+    
+    Returns:
+        Tuple[str, ...]: Key such as ('category', 'fast') or ('all',)
+    
+    Note:
+        Mirrors the route's precedence: category, then tag, then ui.
+    """
+    if category:
+        return ('category', category)
+    if tag:
+        return ('tag', tag)
+    if ui_mode:
+        return ('ui',)
+    return ('all',)
+
+
+def _query_models(key: Tuple[str, ...]) -> Sequence[Mapping[str, Any]]:
+    """
+    Fetch the model list for a query key from the model service.
+    
+    Responsibility: ONLY dispatch a query key to the model service
+    
+    Args:
+        key (Tuple[str, ...]): Key from _models_query_key()
+    
+    Returns:
+        Sequence[Mapping[str, Any]]: Read-only models matching the query
+    """
+    if key[0] == 'category':
+        return model_service.get_models_by_category(key[1])
+    if key[0] == 'tag':
+        return model_service.get_models_by_tag(key[1])
+    if key[0] == 'ui':
+        return model_service.get_models_for_ui()
+    return model_service.get_available_models()
+
+
+def _serialize_models(models: Sequence[Mapping[str, Any]]) -> bytes:
+    """
+    Serialize a model list into the /api/models response body.
+    
+    Responsibility: ONLY build and encode the response body
+    
+    Args:
+        models (Sequence[Mapping[str, Any]]): Models to include
+    
+    Returns:
+        bytes: JSON encoded response body
+    """
+    return app.json.dumps_bytes({
+        'success': True,
+        'models': models,
+        'count': len(models)
+    })
+
+
+def _build_models_responses() -> Dict[Tuple[str, ...], bytes]:
+    """
+    Serialize every known /api/models query once.
+    
+    Responsibility: ONLY precompute response bodies for the static catalog
+    
+    Returns:
+        Dict[Tuple[str, ...], bytes]: Response body per query key
+    
+    Note:
+        The catalog is static config, so these never need invalidating
+        unless catalog reloading is added.
+    """
+    summary = model_service.get_model_summary()
+    
+    keys = [('all',), ('ui',)]
+    keys.extend(('category', category) for category in summary['categories'])
+    keys.extend(('tag', tag) for tag in summary['unique_tags'])
+    
+    return {key: _serialize_models(_query_models(key)) for key in keys}
+
+
+_MODELS_RESPONSES = _build_models_responses()
+
+
 # ============================================================================
 # ROUTE: Serve Frontend
 # ============================================================================
+# In production the frontend is served by Nginx (see deploy/nginx.conf)
+# and these routes are only registered when SERVE_FRONTEND is enabled
 
-@app.route('/')
 def serve_frontend():
     """
     Serve the main HTML page.
@@ -63,10 +261,12 @@ def serve_frontend():
     Returns:
         HTML file
     """
-    return send_from_directory('../frontend', 'index.html')
+    return send_file(
+        os.path.join(FRONTEND_DIR, 'index.html'),
+        conditional=True
+    )
 
 
-@app.route('/<path:path>')
 def serve_static(path):
     """
     Serve static files (CSS, JS, images).
@@ -78,14 +278,88 @@ def serve_static(path):
     
     Returns:
         Static file
+    
+    Note:
+        Responses carry ETag/Last-Modified and a Cache-Control max-age,
+        so unchanged assets are answered with an empty 304.
     """
-    return send_from_directory('../frontend', path)
+    full_path = safe_join(FRONTEND_DIR, path)
+    
+    # Reject paths escaping the frontend directory and missing files
+    if full_path is None or not os.path.isfile(full_path):
+        abort(404)
+    
+    return send_file(full_path, conditional=True, max_age=STATIC_MAX_AGE)
+
+
+if config.SERVE_FRONTEND:
+    app.add_url_rule('/', view_func=serve_frontend)
+    app.add_url_rule('/<path:path>', view_func=serve_static)
 
 
 # ============================================================================
 # ROUTE: Health Check
 # ============================================================================
 
+def _run_health_probe() -> str:
+    """
+    Probe HuggingFace and record the result.
+    
+    Responsibility: ONLY run the connection test and store its outcome
+    
+    Returns:
+        str: 'connected' or 'disconnected'
+    """
+    try:
+        connected = image_service.test_connection()
+    except Exception as e:
+        logger.error(f"Health probe failed: {str(e)}")
+        connected = False
+    
+    status = 'connected' if connected else 'disconnected'
+    
+    with _health_lock:
+        _health_state['huggingface'] = status
+        _health_state['checked_at'] = time.monotonic()
+        _health_state['probe'] = None
+    
+    return status
+
+
+def _get_huggingface_status() -> str:
+    """
+    Get HuggingFace connection status without blocking for long.
+    
+    Responsibility: ONLY return a fresh or last-known connection status
+    
+    Returns:
+        str: 'connected', 'disconnected' or 'unknown'
+    
+    Note:
+        A recent result is returned straight from the cache. Otherwise a
+        single background probe is started (or joined, if one is already
+        running) and awaited for at most HEALTH_CHECK_TIMEOUT seconds,
+        falling back to the last known status.
+    """
+    with _health_lock:
+        age = time.monotonic() - _health_state['checked_at']
+        if age < HEALTH_CACHE_SECONDS:
+            return _health_state['huggingface']
+        
+        probe = _health_state['probe']
+        if probe is None:
+            probe = _health_executor.submit(_run_health_probe)
+            _health_state['probe'] = probe
+        
+        last_known = _health_state['huggingface']
+    
+    try:
+        return probe.result(timeout=HEALTH_CHECK_TIMEOUT)
+    except FutureTimeoutError:
+        logger.warning("Health probe still running - returning last known status")
+        return last_known
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """
@@ -106,8 +380,8 @@ def health_check():
         }
     """
     try:
-        # Test HuggingFace connection
-        hf_status = "connected" if image_service.test_connection() else "disconnected"
+        # Test HuggingFace connection (cached, never blocks for long)
+        hf_status = _get_huggingface_status()
         
         return jsonify({
             'status': 'healthy',
@@ -148,35 +422,23 @@ def get_models():
         GET /api/models
         GET /api/models?category=fast
         GET /api/models?ui=true
+    
+    Note:
+        Known queries are served from JSON bytes serialized at startup.
+        Only unknown categories/tags are looked up per request.
     """
-    try:
-        # Check for query parameters
-        category = request.args.get('category')
-        tag = request.args.get('tag')
-        ui_mode = request.args.get('ui', '').lower() == 'true'
-        
-        # Get models based on filters
-        if category:
-            models = model_service.get_models_by_category(category)
-        elif tag:
-            models = model_service.get_models_by_tag(tag)
-        elif ui_mode:
-            models = model_service.get_models_for_ui()
-        else:
-            models = model_service.get_available_models()
-        
-        return jsonify({
-            'success': True,
-            'models': models,
-            'count': len(models)
-        }), 200
+    # Check for query parameters
+    category = request.args.get('category')
+    tag = request.args.get('tag')
+    ui_mode = request.args.get('ui', '').lower() == 'true'
     
-    except Exception as e:
-        logger.error(f"Failed to get models: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    key = _models_query_key(category, tag, ui_mode)
+    body = _MODELS_RESPONSES.get(key)
+    
+    if body is None:
+        body = _serialize_models(_query_models(key))
+    
+    return app.response_class(body, mimetype='application/json'), 200
 
 
 # ============================================================================
@@ -199,32 +461,139 @@ def get_model_details(model_id):
     Example:
         GET /api/models/black-forest-labs/FLUX.1-dev
     """
-    try:
-        model = model_service.get_model_details(model_id)
-        
-        if model:
-            return jsonify({
-                'success': True,
-                'model': model
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'error': f"Model '{model_id}' not found"
-            }), 404
+    model = model_service.get_model_details(model_id)
     
-    except Exception as e:
-        logger.error(f"Failed to get model details: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    if not model:
+        raise APIError(f"Model '{model_id}' not found", 404)
+    
+    return jsonify({
+        'success': True,
+        'model': model
+    }), 200
 
 
 # ============================================================================
 # ROUTE: Generate Image
 # ============================================================================
 
+def _prepare_generation_request(data: Dict) -> Tuple[str, str, Dict]:
+    """
+    Extract and validate generation inputs from a request body.
+    
+    Responsibility: ONLY turn raw request data into validated inputs
+    
+    Args:
+        data (Dict): Parsed JSON body of a generation request
+    
+    Returns:
+        Tuple[str, str, Dict]: (prompt, model_id, validated parameters)
+    
+    Raises:
+        APIError: If required fields are missing or the model is unknown
+        ValueError: If the prompts are invalid, or parameters cannot be
+            validated for the model
+    
+    Note:
+        Prompts are fully validated here, so the routes tell the image
+        service to skip its own prompt validation.
+    """
+    # Extract required parameters
+    prompt = data.get('prompt')
+    model_id = data.get('model_id')
+    
+    if not prompt:
+        raise APIError('Prompt is required')
+    
+    if not model_id:
+        raise APIError('Model ID is required')
+    
+    # Validate model exists
+    if not model_service.validate_model_id(model_id):
+        raise APIError(f"Invalid model ID: '{model_id}'")
+    
+    # Extract optional parameters
+    width = data.get('width', 768)
+    height = data.get('height', 768)
+    num_inference_steps = data.get('num_inference_steps')
+    guidance_scale = data.get('guidance_scale')
+    negative_prompt = data.get('negative_prompt')
+    seed = data.get('seed')
+    
+    # Validate and prepare parameters for the model
+    params = {
+        'width': width,
+        'height': height
+    }
+    
+    if num_inference_steps is not None:
+        params['num_inference_steps'] = num_inference_steps
+    
+    if guidance_scale is not None:
+        params['guidance_scale'] = guidance_scale
+    
+    if negative_prompt:
+        params['negative_prompt'] = negative_prompt
+    
+    if seed is not None:
+        params['seed'] = seed
+    
+    # Validate parameters against model constraints
+    validated_params = model_service.validate_and_prepare_parameters(
+        model_id,
+        params
+    )
+    
+    # Validate prompts as the image service would (invalid input -> 400)
+    validate_prompt(prompt)
+    if validated_params.get('negative_prompt'):
+        validate_negative_prompt(validated_params['negative_prompt'])
+    
+    # Optional output format (PNG unless the client asks otherwise)
+    image_format = data.get('format')
+    if image_format is not None:
+        image_format = str(image_format).upper()
+        if image_format not in IMAGE_FORMATS:
+            raise APIError(
+                f"Unsupported format: '{data.get('format')}' "
+                f"(supported: {', '.join(IMAGE_FORMATS).lower()})"
+            )
+        validated_params['image_format'] = image_format
+    
+    return prompt, model_id, validated_params
+
+
+def _refresh_cached_timestamp(body: bytes) -> bytes:
+    """
+    Replace metadata.timestamp in a cached generation response body.
+    
+    Responsibility: ONLY splice the current time into stored JSON bytes
+    
+    Args:
+        body (bytes): Response body as stored by set_cached_generation()
+    
+    Returns:
+        bytes: Same body with the current timestamp
+    
+    Note:
+        Avoids parsing and re-serializing the multi-MB base64 payload.
+        The search runs backwards since metadata is the last field, and a
+        "timestamp": key inside the prompt text cannot match, because the
+        quotes in JSON string values are escaped.
+    """
+    key_start = body.rfind(b'"timestamp":')
+    if key_start == -1:
+        return body
+    
+    value_start = body.index(b'"', key_start + len(b'"timestamp":')) + 1
+    value_end = body.index(b'"', value_start)
+    
+    return b''.join((
+        body[:value_start],
+        current_timestamp().encode('ascii'),
+        body[value_end:]
+    ))
+
+
 @app.route('/api/generate', methods=['POST'])
 def generate_image():
     """
@@ -241,16 +610,21 @@ def generate_image():
             "num_inference_steps": 30,
             "guidance_scale": 7.5,
             "negative_prompt": "blurry, low quality",
-            "seed": 42
+            "seed": 42,
+            "format": "png"
         }
     
+    "format" is optional: "png" (default), "webp" (much smaller) or
+    "jpeg" (fastest to encode).
+    
     Returns:
-        JSON: Generated image (base64) and metadata
+        JSON: Generated image (base64), its mimetype and metadata
     
     Example response:
         {
             "success": true,
             "image": "base64_encoded_image...",
+            "mimetype": "image/png",
             "metadata": {
                 "model_id": "...",
                 "prompt": "...",
@@ -260,101 +634,189 @@ def generate_image():
             }
         }
     """
-    try:
-        # Parse request body
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is required'
-            }), 400
-        
-        # Extract required parameters
-        prompt = data.get('prompt')
-        model_id = data.get('model_id')
-        
-        if not prompt:
-            return jsonify({
-                'success': False,
-                'error': 'Prompt is required'
-            }), 400
-        
-        if not model_id:
-            return jsonify({
-                'success': False,
-                'error': 'Model ID is required'
-            }), 400
-        
-        # Validate model exists
-        if not model_service.validate_model_id(model_id):
-            return jsonify({
-                'success': False,
-                'error': f"Invalid model ID: '{model_id}'"
-            }), 400
-        
-        # Extract optional parameters
-        width = data.get('width', 768)
-        height = data.get('height', 768)
-        num_inference_steps = data.get('num_inference_steps')
-        guidance_scale = data.get('guidance_scale')
-        negative_prompt = data.get('negative_prompt')
-        seed = data.get('seed')
+    # Parse request body
+    data = request.get_json()
+    
+    if not data:
+        raise APIError('Request body is required')
+    
+    prompt, model_id, validated_params = _prepare_generation_request(data)
+    
+    # Seeded requests are deterministic, so identical ones can be cached
+    cache_key = None
+    if 'seed' in validated_params:
+        cache_key = make_generation_key(prompt, model_id, validated_params)
+        cached_body = get_cached_generation(cache_key)
         
-        # Validate and prepare parameters for the model
-        params = {
-            'width': width,
-            'height': height
+        if cached_body is not None:
+            logger.info(f"Serving cached image for model: {model_id}")
+            
+            # Same as the in-memory result cache: a hit gets a fresh timestamp
+            body = _refresh_cached_timestamp(cached_body)
+            
+            response = app.response_class(body, mimetype='application/json')
+            response.headers['X-Cache'] = 'HIT'
+            return response, 200
+    
+    logger.info(f"Generating image with model: {model_id}")
+    
+    # Generate image
+    result = image_service.generate_image(
+        prompt=prompt,
+        model_id=model_id,
+        _skip_validation=True,
+        **validated_params
+    )
+    
+    # Return result
+    if not result['success']:
+        return jsonify(result), 500
+    
+    if cache_key is None:
+        return jsonify(result), 200
+    
+    body = app.json.dumps_bytes(result)
+    stored = set_cached_generation(cache_key, body, GENERATION_CACHE_TTL)
+    
+    response = app.response_class(body, mimetype='application/json')
+    
+    # Only report a miss when the cache is actually in use
+    if stored:
+        response.headers['X-Cache'] = 'MISS'
+    return response, 200
+
+
+# ============================================================================
+# ROUTE: Generate Image (Raw Bytes)
+# ============================================================================
+
+@app.route('/api/generate/image', methods=['POST'])
+def generate_image_raw():
+    """
+    Generate an image and return it as an image file.
+    
+    Responsibility: ONLY coordinate a binary image generation request
+    
+    Request Body (JSON):
+        Same as /api/generate
+    
+    Returns:
+        image/png (or image/webp, image/jpeg) body on success,
+        JSON error otherwise
+    
+    Response Headers:
+        X-Generation-Model: Model that was used
+        X-Generation-Seed: Seed that was used (only if one was given)
+        X-Generation-Width / X-Generation-Height: Image size in pixels
+        X-Generation-Timestamp: When the image was generated
+    
+    Note:
+        Skips base64, so the body is about 25% smaller than /api/generate
+        and the browser can use it directly as an image.
+    """
+    data = request.get_json()
+    
+    if not data:
+        raise APIError('Request body is required')
+    
+    prompt, model_id, validated_params = _prepare_generation_request(data)
+    
+    logger.info(f"Generating raw image with model: {model_id}")
+    
+    result = image_service.generate_image_bytes(
+        prompt=prompt,
+        model_id=model_id,
+        _skip_validation=True,
+        **validated_params
+    )
+    
+    if not result['success']:
+        return jsonify(result), 500
+    
+    metadata = result['metadata']
+    response = app.response_class(
+        result['image_bytes'],
+        mimetype=result['mimetype']
+    )
+    response.headers['X-Generation-Model'] = metadata['model_id']
+    response.headers['X-Generation-Width'] = str(metadata['width'])
+    response.headers['X-Generation-Height'] = str(metadata['height'])
+    response.headers['X-Generation-Timestamp'] = metadata['timestamp']
+    
+    if 'seed' in metadata['parameters']:
+        response.headers['X-Generation-Seed'] = str(metadata['parameters']['seed'])
+    
+    return response, 200
+
+
+# ============================================================================
+# ROUTE: Generate Image Batch
+# ============================================================================
+
+@app.route('/api/generate/batch', methods=['POST'])
+def generate_images_batch():
+    """
+    Generate several images in one request.
+    
+    Responsibility: ONLY coordinate a batch generation request
+    
+    Request Body (JSON):
+        {
+            "requests": [
+                {"prompt": "A red car", "model_id": "...", "seed": 1},
+                {"prompt": "A blue car", "model_id": "...", "seed": 2}
+            ]
         }
-        
-        if num_inference_steps is not None:
-            params['num_inference_steps'] = num_inference_steps
-        
-        if guidance_scale is not None:
-            params['guidance_scale'] = guidance_scale
-        
-        if negative_prompt:
-            params['negative_prompt'] = negative_prompt
-        
-        if seed is not None:
-            params['seed'] = seed
-        
-        # Validate parameters against model constraints
-        validated_params = model_service.validate_and_prepare_parameters(
-            model_id,
-            params
+    
+    Each entry accepts the same fields as /api/generate.
+    
+    Returns:
+        JSON: One result per entry, in request order
+    
+    Example response:
+        {
+            "success": true,
+            "results": [{"success": true, "image": "...", "metadata": {...}}],
+            "count": 2
+        }
+    
+    Note:
+        The HuggingFace API takes one prompt per call, so the batch is
+        sent as concurrent calls rather than a single batched call.
+    """
+    data = request.get_json()
+    items = data.get('requests') if isinstance(data, dict) else None
+    
+    if not isinstance(items, list) or not items:
+        raise APIError("A non-empty 'requests' list is required")
+    
+    if len(items) > MAX_BATCH_SIZE:
+        raise APIError(
+            f"Too many requests in batch: {len(items)} "
+            f"(maximum: {MAX_BATCH_SIZE})"
         )
+    
+    # Validate every entry before generating anything
+    batch = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise APIError('Each batch entry must be an object')
         
-        logger.info(f"Generating image with model: {model_id}")
-        
-        # Generate image
-        result = image_service.generate_image(
-            prompt=prompt,
-            model_id=model_id,
+        prompt, model_id, validated_params = _prepare_generation_request(item)
+        batch.append({
+            'prompt': prompt,
+            'model_id': model_id,
+            '_skip_validation': True,
             **validated_params
-        )
-        
-        # Return result
-        if result['success']:
-            return jsonify(result), 200
-        else:
-            return jsonify(result), 500
-    
-    except ValueError as e:
-        # Validation errors
-        logger.warning(f"Validation error: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 400
+        })
     
-    except Exception as e:
-        # Unexpected errors
-        logger.error(f"Image generation failed: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    results = image_service.generate_images(batch)
+    
+    return jsonify({
+        'success': all(result['success'] for result in results),
+        'results': results,
+        'count': len(results)
+    }), 200
 
 
 # ============================================================================
@@ -371,26 +833,68 @@ def get_model_summary():
     Returns:
         JSON: Model summary with counts and categories
     """
-    try:
-        summary = model_service.get_model_summary()
-        
-        return jsonify({
-            'success': True,
-            'summary': summary
-        }), 200
+    summary = model_service.get_model_summary()
     
-    except Exception as e:
-        logger.error(f"Failed to get model summary: {str(e)}")
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    return jsonify({
+        'success': True,
+        'summary': summary
+    }), 200
 
 
 # ============================================================================
 # Error Handlers
 # ============================================================================
 
+@app.errorhandler(APIError)
+def api_error(error):
+    """
+    Handle errors raised by routes.
+    
+    Responsibility: ONLY format APIError response
+    """
+    return jsonify({
+        'success': False,
+        'error': str(error)
+    }), error.status
+
+
+@app.errorhandler(ValueError)
+def validation_error(error):
+    """
+    Handle validation errors from services and validators.
+    
+    Responsibility: ONLY format validation error response
+    """
+    logger.warning(f"Validation error: {str(error)}")
+    return jsonify({
+        'success': False,
+        'error': str(error)
+    }), 400
+
+
+@app.errorhandler(Exception)
+def unexpected_error(error):
+    """
+    Handle any other exception raised by a route.
+    
+    Responsibility: ONLY format unexpected error response
+    
+    Note:
+        HTTP errors (e.g. malformed JSON bodies) keep their own status code.
+    """
+    if isinstance(error, HTTPException):
+        return jsonify({
+            'success': False,
+            'error': error.description
+        }), error.code
+    
+    logger.error(f"Request to {request.path} failed: {str(error)}")
+    return jsonify({
+        'success': False,
+        'error': str(error)
+    }), 500
+
+
 @app.errorhandler(404)
 def not_found(error):
     """
@@ -435,13 +939,22 @@ if __name__ == '__main__':
         logger.info(f"Starting server on {config.HOST}:{config.PORT}")
         logger.info(f"Debug mode: {config.DEBUG}")
         
+        if not config.DEBUG:
+            logger.warning(
+                "Running the development server with DEBUG off. "
+                "For production run: gunicorn app:app"
+            )
+        
         # Start Flask development server
         # WARNING: This is for development only!
-        # In production, use a proper WSGI server like Gunicorn
+        # In production, run Gunicorn with gevent workers (gunicorn.conf.py)
+        # threaded=True: one thread per request, so a slow generation
+        # does not block other requests
         app.run(
             host=config.HOST,
             port=config.PORT,
-            debug=config.DEBUG
+            debug=config.DEBUG,
+            threaded=True
         )
     
     except Exception as e:
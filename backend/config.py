@@ -10,9 +10,12 @@ The Config class provides a centralized location for all settings,
 making it easy to modify behavior without changing code throughout
 the application.
 
+Settings are computed once at import time as module-level constants.
+Hot request paths import the constants they need directly; the Config
+class and config instance remain as a namespace over the same values.
+
 Usage:
-    from config import Config
-    config = Config()
+    from config import config, MAX_BATCH_SIZE
     api_key = config.HF_TOKEN
 """
 
@@ -21,145 +24,200 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
+def _get_env(key: str, default: str = '') -> str:
+    """
+    Get string environment variable with optional default.
+    
+    Responsibility: ONLY retrieve and return string env var
+    
+    Args:
+        key (str): Environment variable name
+        default (str): Default value if not found
+    
+    Returns:
+        str: Environment variable value or default
+    """
+    return os.getenv(key, default)
+
+
+def _get_env_int(key: str, default: int) -> int:
+    """
+    Get integer environment variable with default.
+    
+    Responsibility: ONLY retrieve and convert env var to int
+    
+    Args:
+        key (str): Environment variable name
+        default (int): Default value if not found or invalid
+    
+    Returns:
+        int: Environment variable as integer or default
+    """
+    try:
+        return int(os.getenv(key, default))
+    except (ValueError, TypeError):
+        # If conversion fails, return default
+        # This prevents crashes from malformed .env files
+        return default
+
+
+def _get_env_bool(key: str, default: bool) -> bool:
+    """
+    Get boolean environment variable with default.
+    
+    Responsibility: ONLY retrieve and convert env var to bool
+    
+    Args:
+        key (str): Environment variable name
+        default (bool): Default value if not found
+    
+    Returns:
+        bool: Environment variable as boolean or default
+    
+    Note:
+        Accepts 'true', '1', 'yes' as True (case-insensitive)
+        Everything else is considered False
+    """
+    value = os.getenv(key, '').lower()
+    if value in ('true', '1', 'yes'):
+        return True
+    elif value in ('false', '0', 'no'):
+        return False
+    return default
+
+
+def _get_required_env(key: str) -> str:
+    """
+    Get required environment variable or raise error.
+    
+    Responsibility: ONLY retrieve required env var with validation
+    
+    Args:
+        key (str): Environment variable name
+    
+    Returns:
+        str: Environment variable value
+    
+    Raises:
+        ValueError: If environment variable is not set
+    """
+    value = os.getenv(key)
+    if not value:
+        raise ValueError(
+            f"Required environment variable '{key}' is not set. "
+            f"Please create a .env file with {key}=your_value"
+        )
+    return value
+
+
+# Load environment variables from .env file
+# This allows local development without exposing secrets
+load_dotenv()
+
+# API Configuration
+HF_TOKEN = _get_required_env('HF_TOKEN')
+
+# Server Configuration
+HOST = _get_env('HOST', '0.0.0.0')
+PORT = _get_env_int('PORT', 5000)
+DEBUG = _get_env_bool('DEBUG', True)
+
+# Serve the frontend from Flask (development only by default)
+# In production Nginx serves the static files directly
+SERVE_FRONTEND = _get_env_bool('SERVE_FRONTEND', DEBUG)
+
+# Seconds browsers may cache frontend assets before revalidating
+STATIC_MAX_AGE = _get_env_int('STATIC_MAX_AGE', 3600)
+
+# Production Server Configuration (see gunicorn.conf.py)
+# WORKER_CLASS is 'gevent' (default) or 'gthread'; THREADS applies to gthread
+WORKERS = _get_env_int('WORKERS', 4)
+WORKER_CLASS = _get_env('WORKER_CLASS', 'gevent')
+WORKER_CONNECTIONS = _get_env_int('WORKER_CONNECTIONS', 1000)
+THREADS = _get_env_int('THREADS', 16)
+
+# Model Configuration
+DEFAULT_MODEL = _get_env(
+    'DEFAULT_MODEL',
+    'black-forest-labs/FLUX.1-dev'
+)
+
+# Cache Configuration
+# Redis is optional - leave REDIS_URL empty to disable caching
+REDIS_URL = _get_env('REDIS_URL', '')
+GENERATION_CACHE_TTL = _get_env_int('GENERATION_CACHE_TTL', 86400)
+
+# Health Check
+# Seconds to reuse a probe result, and max seconds to wait for a probe
+HEALTH_CACHE_SECONDS = 5
+HEALTH_CHECK_TIMEOUT = 1.0
+
+# Generation Limits
+# These prevent abuse and ensure reasonable resource usage
+MAX_PROMPT_LENGTH = 1000
+MAX_NEGATIVE_PROMPT_LENGTH = 500
+MIN_IMAGE_SIZE = 256
+MAX_IMAGE_SIZE = 2048
+MAX_BATCH_SIZE = 8
+
+# Default Generation Parameters
+# These provide good starting values for most use cases
+DEFAULT_WIDTH = 768
+DEFAULT_HEIGHT = 768
+DEFAULT_STEPS = 30
+DEFAULT_GUIDANCE_SCALE = 7.5
+
+
 class Config:
     """
-    Application configuration class.
+    Application configuration namespace.
     
-    Loads configuration from environment variables and provides
-    sensible defaults for all settings. Uses python-dotenv to
-    load variables from a .env file if present.
+    Exposes the module-level settings as attributes, so existing
+    code can keep using config.HF_TOKEN, config.PORT, etc.
     
     Attributes:
         HF_TOKEN (str): Hugging Face API token for authentication
         HOST (str): Server host address
         PORT (int): Server port number
         DEBUG (bool): Debug mode flag
+        SERVE_FRONTEND (bool): Serve frontend files from Flask (off behind Nginx)
+        STATIC_MAX_AGE (int): Browser cache lifetime for frontend assets
+        WORKERS (int): Gunicorn worker processes
+        WORKER_CLASS (str): Gunicorn worker type ('gevent' or 'gthread')
+        WORKER_CONNECTIONS (int): Concurrent connections per gevent worker
+        THREADS (int): Threads per gthread worker
         DEFAULT_MODEL (str): Default image generation model
         MAX_PROMPT_LENGTH (int): Maximum allowed prompt length
         DEFAULT_WIDTH (int): Default image width in pixels
         DEFAULT_HEIGHT (int): Default image height in pixels
+        REDIS_URL (str): Redis URL for generation caching (empty disables it)
+        GENERATION_CACHE_TTL (int): Seconds to cache seeded generation results
     """
     
-    def __init__(self):
-        """
-        Initialize configuration by loading environment variables.
-        
-        Automatically loads variables from .env file if it exists,
-        then sets all configuration attributes with defaults.
-        """
-        # Load environment variables from .env file
-        # This allows local development without exposing secrets
-        load_dotenv()
-        
-        # API Configuration
-        self.HF_TOKEN = self._get_required_env('HF_TOKEN')
-        
-        # Server Configuration
-        self.HOST = self._get_env('HOST', '0.0.0.0')
-        self.PORT = self._get_env_int('PORT', 5000)
-        self.DEBUG = self._get_env_bool('DEBUG', True)
-        
-        # Model Configuration
-        self.DEFAULT_MODEL = self._get_env(
-            'DEFAULT_MODEL',
-            'black-forest-labs/FLUX.1-dev'
-        )
-        
-        # Generation Limits
-        # These prevent abuse and ensure reasonable resource usage
-        self.MAX_PROMPT_LENGTH = 1000
-        self.MAX_NEGATIVE_PROMPT_LENGTH = 500
-        self.MIN_IMAGE_SIZE = 256
-        self.MAX_IMAGE_SIZE = 2048
-        
-        # Default Generation Parameters
-        # These provide good starting values for most use cases
-        self.DEFAULT_WIDTH = 768
-        self.DEFAULT_HEIGHT = 768
-        self.DEFAULT_STEPS = 30
-        self.DEFAULT_GUIDANCE_SCALE = 7.5
-    
-    def _get_env(self, key: str, default: str = '') -> str:
-        """
-        Get string environment variable with optional default.
-        
-        Responsibility: ONLY retrieve and return string env var
-        
-        Args:
-            key (str): Environment variable name
-            default (str): Default value if not found
-        
-        Returns:
-            str: Environment variable value or default
-        """
-        return os.getenv(key, default)
-    
-    def _get_env_int(self, key: str, default: int) -> int:
-        """
-        Get integer environment variable with default.
-        
-        Responsibility: ONLY retrieve and convert env var to int
-        
-        Args:
-            key (str): Environment variable name
-            default (int): Default value if not found or invalid
-        
-        Returns:
-            int: Environment variable as integer or default
-        """
-        try:
-            return int(os.getenv(key, default))
-        except (ValueError, TypeError):
-            # If conversion fails, return default
-            # This prevents crashes from malformed .env files
-            return default
-    
-    def _get_env_bool(self, key: str, default: bool) -> bool:
-        """
-        Get boolean environment variable with default.
-        
-        Responsibility: ONLY retrieve and convert env var to bool
-        
-        Args:
-            key (str): Environment variable name
-            default (bool): Default value if not found
-        
-        Returns:
-            bool: Environment variable as boolean or default
-            
-        Note:
-            Accepts 'true', '1', 'yes' as True (case-insensitive)
-            Everything else is considered False
-        """
-        value = os.getenv(key, '').lower()
-        if value in ('true', '1', 'yes'):
-            return True
-        elif value in ('false', '0', 'no'):
-            return False
-        return default
-    
-    def _get_required_env(self, key: str) -> str:
-        """
-        Get required environment variable or raise error.
-        
-        Responsibility: ONLY retrieve required env var with validation
-        
-        Args:
-            key (str): Environment variable name
-        
-        Returns:
-            str: Environment variable value
-        
-        Raises:
-            ValueError: If environment variable is not set
-        """
-        value = os.getenv(key)
-        if not value:
-            raise ValueError(
-                f"Required environment variable '{key}' is not set. "
-                f"Please create a .env file with {key}=your_value"
-            )
-        return value
+    HF_TOKEN = HF_TOKEN
+    HOST = HOST
+    PORT = PORT
+    DEBUG = DEBUG
+    SERVE_FRONTEND = SERVE_FRONTEND
+    STATIC_MAX_AGE = STATIC_MAX_AGE
+    WORKERS = WORKERS
+    WORKER_CLASS = WORKER_CLASS
+    WORKER_CONNECTIONS = WORKER_CONNECTIONS
+    THREADS = THREADS
+    DEFAULT_MODEL = DEFAULT_MODEL
+    REDIS_URL = REDIS_URL
+    GENERATION_CACHE_TTL = GENERATION_CACHE_TTL
+    HEALTH_CACHE_SECONDS = HEALTH_CACHE_SECONDS
+    HEALTH_CHECK_TIMEOUT = HEALTH_CHECK_TIMEOUT
+    MAX_PROMPT_LENGTH = MAX_PROMPT_LENGTH
+    MAX_NEGATIVE_PROMPT_LENGTH = MAX_NEGATIVE_PROMPT_LENGTH
+    MIN_IMAGE_SIZE = MIN_IMAGE_SIZE
+    MAX_IMAGE_SIZE = MAX_IMAGE_SIZE
+    MAX_BATCH_SIZE = MAX_BATCH_SIZE
+    DEFAULT_WIDTH = DEFAULT_WIDTH
+    DEFAULT_HEIGHT = DEFAULT_HEIGHT
+    DEFAULT_STEPS = DEFAULT_STEPS
+    DEFAULT_GUIDANCE_SCALE = DEFAULT_GUIDANCE_SCALE
     
     def validate(self) -> bool:
         """
@@ -195,6 +253,7 @@ class Config:
         return True
 
 
+
 # Create a global config instance for easy importing
 # This follows the Singleton pattern - one config for the whole app
 config = Config()
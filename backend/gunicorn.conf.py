@@ -0,0 +1,44 @@
+"""
+Gunicorn Configuration
+
+Production server settings for the image generation API.
+
+Uses gevent workers so a worker is not blocked while it waits on the
+HuggingFace API: each worker handles many requests concurrently and
+switches between them whenever one is waiting on network I/O.
+The gevent worker monkey-patches the standard library itself, so
+app.py does not need to.
+
+This is also why the routes stay synchronous: the blocking HuggingFace
+call already yields to other requests under gevent. Flask async views
+would not add concurrency on a WSGI server, since each one runs its own
+event loop for the length of a single request.
+
+Where gevent is not available, set WORKER_CLASS=gthread to use plain
+threads instead (THREADS per worker). The HuggingFace call spends its
+time in socket reads, which release the GIL, so the threads of one
+worker still overlap their waits.
+
+Usage:
+    gunicorn app:app
+
+    (Gunicorn picks up this file automatically when started from the
+    backend directory, or pass it explicitly with -c gunicorn.conf.py)
+"""
+
+from config import config
+
+
+# Listen on the same address as the development server
+bind = f"{config.HOST}:{config.PORT}"
+
+# Cooperative workers: many concurrent requests per worker process
+worker_class = config.WORKER_CLASS
+workers = config.WORKERS
+worker_connections = config.WORKER_CONNECTIONS
+
+# Only used by the gthread worker class
+threads = config.THREADS
+
+# Image generation can take a while, so allow slow upstream responses
+timeout = 120
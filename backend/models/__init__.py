@@ -1,6 +1,8 @@
 """Models package initialization."""
 from .models_config import (
     get_all_models,
+    get_all_models_mutable,
+    get_catalog_version,
     get_model_by_id,
     get_models_by_category,
     is_valid_model_id,
@@ -10,6 +12,8 @@ from .models_config import (
 
 __all__ = [
     'get_all_models',
+    'get_all_models_mutable',
+    'get_catalog_version',
     'get_model_by_id',
     'get_models_by_category',
     'is_valid_model_id',
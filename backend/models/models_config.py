@@ -18,7 +18,11 @@ Usage:
     model_info = get_model_by_id('black-forest-labs/FLUX.1-dev')
 """
 
-from typing import List, Dict, Optional
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, List, Dict, Mapping, Optional, Tuple
 
 
 # Model registry - centralized list of all available models
@@ -131,25 +135,134 @@ AVAILABLE_MODELS = [
     }
 ]
 
+# Freeze the registry: read-only models with tag tuples, in a tuple.
+# Getters can then hand out the registry entries themselves, since
+# callers cannot modify them, instead of copying on every call.
+# Model IDs are interned, as they are used as keys on every request.
+AVAILABLE_MODELS = tuple(
+    MappingProxyType({
+        **model,
+        'id': sys.intern(model['id']),
+        'tags': tuple(model['tags'])
+    })
+    for model in AVAILABLE_MODELS
+)
 
-def get_all_models() -> List[Dict]:
+
+def _build_model_indexes() -> Tuple[Dict, Dict, Dict, Dict]:
+    """
+    Index the model registry by id, category, tag and provider.
+    
+    Responsibility: ONLY build lookup tables over AVAILABLE_MODELS
+    
+    Returns:
+        Tuple[Dict, Dict, Dict, Dict]: Models by id, by category, by tag,
+            by provider (all but the id index hold tuples of models)
+    
+    Note:
+        Built once in a single pass at import time, so lookups are
+        a dict access instead of a scan over every model.
+        Tag keys are lowercased (and de-duplicated per model) so tag
+        lookups are case-insensitive without lowering every tag per call.
+    """
+    by_id = {}
+    by_category = defaultdict(list)
+    by_tag = defaultdict(list)
+    by_provider = defaultdict(list)
+    
+    for model in AVAILABLE_MODELS:
+        by_id[model['id']] = model
+        by_category[model['category']].append(model)
+        by_provider[model['provider']].append(model)
+        for tag in frozenset(tag.lower() for tag in model['tags']):
+            by_tag[tag].append(model)
+    
+    return (
+        by_id,
+        {category: tuple(models) for category, models in by_category.items()},
+        {tag: tuple(models) for tag, models in by_tag.items()},
+        {provider: tuple(models) for provider, models in by_provider.items()}
+    )
+
+
+# Lookup indexes over the registry
+(
+    _MODELS_BY_ID,
+    _MODELS_BY_CATEGORY,
+    _MODELS_BY_TAG,
+    _MODELS_BY_PROVIDER
+) = _build_model_indexes()
+
+# Model names and IDs in registry order
+_MODEL_NAMES = tuple(model['name'] for model in AVAILABLE_MODELS)
+_MODEL_IDS = tuple(model['id'] for model in AVAILABLE_MODELS)
+
+# Every tag in use, sorted once here rather than on each call
+_ALL_TAGS = tuple(sorted(_MODELS_BY_TAG))
+
+# Catalog version - increment it together with any edit to the registry.
+# The registry is frozen at import and never reloaded at runtime, so this
+# only changes with the code; caches derived from the catalog (summaries,
+# UI lists) take it as their key to tie them to the data they came from
+_catalog_version = 1
+
+
+def get_catalog_version() -> int:
+    """
+    Get the current version of the model catalog.
+    
+    Responsibility: ONLY return the catalog version token
+    
+    Returns:
+        int: Version number, incremented by hand when the registry is edited
+    
+    Example:
+        >>> summary = compute_summary(get_catalog_version())
+    """
+    return _catalog_version
+
+
+def get_all_models() -> Tuple[Mapping, ...]:
     """
     Get list of all available models.
     
     Responsibility: ONLY return the complete model list
     
     Returns:
-        List[Dict]: List of all model configurations
+        Tuple[Mapping, ...]: Read-only model configurations
+    
+    Note:
+        Returns the registry itself, without copying. Use
+        get_all_models_mutable() for copies that can be modified.
     
     Example:
         >>> models = get_all_models()
         >>> print(f"Found {len(models)} models")
         Found 5 models
     """
-    return AVAILABLE_MODELS.copy()
+    return AVAILABLE_MODELS
 
 
-def get_model_by_id(model_id: str) -> Optional[Dict]:
+def get_all_models_mutable() -> List[Dict]:
+    """
+    Get a modifiable copy of all available models.
+    
+    Responsibility: ONLY return fresh, mutable copies of the models
+    
+    Returns:
+        List[Dict]: New model dicts (with tags as lists) on every call
+    
+    Example:
+        >>> models = get_all_models_mutable()
+        >>> models[0]['name'] = 'Renamed'  # Registry is not affected
+    """
+    return [
+        {**model, 'tags': list(model['tags'])}
+        for model in AVAILABLE_MODELS
+    ]
+
+
+def get_model_by_id(model_id: str) -> Optional[Mapping]:
     """
     Get specific model configuration by ID.
     
@@ -159,20 +272,18 @@ def get_model_by_id(model_id: str) -> Optional[Dict]:
         model_id (str): Unique model identifier (e.g., 'black-forest-labs/FLUX.1-dev')
     
     Returns:
-        Optional[Dict]: Model configuration if found, None otherwise
+        Optional[Mapping]: Read-only model configuration if found,
+            None otherwise
     
     Example:
         >>> model = get_model_by_id('black-forest-labs/FLUX.1-dev')
         >>> print(model['name'])
         FLUX.1 Dev
     """
-    for model in AVAILABLE_MODELS:
-        if model['id'] == model_id:
-            return model.copy()
-    return None
+    return _MODELS_BY_ID.get(model_id)
 
 
-def get_models_by_category(category: str) -> List[Dict]:
+def get_models_by_category(category: str) -> Tuple[Mapping, ...]:
     """
     Get all models in a specific category.
     
@@ -182,42 +293,92 @@ def get_models_by_category(category: str) -> List[Dict]:
         category (str): Category name ('general', 'fast', 'artistic', etc.)
     
     Returns:
-        List[Dict]: List of models in the specified category
+        Tuple[Mapping, ...]: Read-only models in the specified category
     
     Example:
         >>> fast_models = get_models_by_category('fast')
         >>> print(f"Found {len(fast_models)} fast models")
         Found 1 fast models
     """
-    return [
-        model.copy()
-        for model in AVAILABLE_MODELS
-        if model['category'] == category
-    ]
+    return _MODELS_BY_CATEGORY.get(category, ())
 
 
-def get_models_by_tag(tag: str) -> List[Dict]:
+def get_models_by_tag(tag: str) -> Tuple[Mapping, ...]:
     """
     Get all models with a specific tag.
     
     Responsibility: ONLY filter models by tag
     
     Args:
-        tag (str): Tag name ('realistic', 'fast', 'artistic', etc.)
+        tag (str): Tag name ('realistic', 'fast', 'artistic', etc.),
+            matched case-insensitively
     
     Returns:
-        List[Dict]: List of models with the specified tag
+        Tuple[Mapping, ...]: Read-only models with the specified tag
     
     Example:
         >>> realistic = get_models_by_tag('realistic')
         >>> for model in realistic:
         ...     print(model['name'])
     """
-    return [
-        model.copy()
-        for model in AVAILABLE_MODELS
-        if tag in model['tags']
-    ]
+    return _MODELS_BY_TAG.get(tag.lower(), ())
+
+
+def get_models_by_provider(provider: str) -> Tuple[Mapping, ...]:
+    """
+    Get all models from a specific provider.
+    
+    Responsibility: ONLY filter models by provider
+    
+    Args:
+        provider (str): Inference provider ('fal-ai', 'replicate', etc.)
+    
+    Returns:
+        Tuple[Mapping, ...]: Read-only models from the specified provider
+    """
+    return _MODELS_BY_PROVIDER.get(provider, ())
+
+
+def get_model_counts_by_category() -> Dict[str, int]:
+    """
+    Count models in each category.
+    
+    Responsibility: ONLY count models per category from the index
+    
+    Returns:
+        Dict[str, int]: Category name to number of models
+    """
+    return {
+        category: len(models)
+        for category, models in _MODELS_BY_CATEGORY.items()
+    }
+
+
+def get_model_counts_by_provider() -> Dict[str, int]:
+    """
+    Count models from each provider.
+    
+    Responsibility: ONLY count models per provider from the index
+    
+    Returns:
+        Dict[str, int]: Provider name to number of models
+    """
+    return {
+        provider: len(models)
+        for provider, models in _MODELS_BY_PROVIDER.items()
+    }
+
+
+def get_all_tags() -> Tuple[str, ...]:
+    """
+    Get every tag used by any model.
+    
+    Responsibility: ONLY list the tag index keys
+    
+    Returns:
+        Tuple[str, ...]: Unique tags, sorted alphabetically
+    """
+    return _ALL_TAGS
 
 
 def is_valid_model_id(model_id: str) -> bool:
@@ -238,41 +399,41 @@ def is_valid_model_id(model_id: str) -> bool:
         >>> is_valid_model_id('invalid-model')
         False
     """
-    return any(model['id'] == model_id for model in AVAILABLE_MODELS)
+    return model_id in _MODELS_BY_ID
 
 
-def get_model_names_list() -> List[str]:
+def get_model_names_list() -> Tuple[str, ...]:
     """
     Get simple list of model names for display.
     
-    Responsibility: ONLY extract and return model names
+    Responsibility: ONLY return the precomputed model names
     
     Returns:
-        List[str]: List of human-readable model names
+        Tuple[str, ...]: Human-readable model names (read-only)
     
     Example:
         >>> names = get_model_names_list()
         >>> print(names)
-        ['FLUX.1 Dev', 'SDXL Lightning', ...]
+        ('FLUX.1 Dev', 'SDXL Lightning', ...)
     """
-    return [model['name'] for model in AVAILABLE_MODELS]
+    return _MODEL_NAMES
 
 
-def get_model_ids_list() -> List[str]:
+def get_model_ids_list() -> Tuple[str, ...]:
     """
     Get simple list of model IDs.
     
-    Responsibility: ONLY extract and return model IDs
+    Responsibility: ONLY return the precomputed model IDs
     
     Returns:
-        List[str]: List of model identifiers
+        Tuple[str, ...]: Model identifiers (read-only)
     
     Example:
         >>> ids = get_model_ids_list()
         >>> print(ids[0])
         black-forest-labs/FLUX.1-dev
     """
-    return [model['id'] for model in AVAILABLE_MODELS]
+    return _MODEL_IDS
 
 
 def get_default_parameters_for_model(model_id: str) -> Dict:
@@ -295,9 +456,9 @@ def get_default_parameters_for_model(model_id: str) -> Dict:
         >>> print(params)
         {'width': 768, 'height': 768, 'steps': 30, 'guidance_scale': 7.5}
     """
-    model = get_model_by_id(model_id)
+    model = _MODELS_BY_ID.get(model_id)
     
-    if not model:
+    if model is None:
         raise ValueError(f"Model '{model_id}' not found in registry")
     
     return {
@@ -308,6 +469,140 @@ def get_default_parameters_for_model(model_id: str) -> Dict:
     }
 
 
+# Source template for per-model parameter validators.
+# Bounds are filled in as literals by _build_parameter_validator().
+_VALIDATOR_TEMPLATE = """
+def validate(parameters):
+    validated = {{}}
+    
+    # Clamp width/height and round down to a multiple of 8
+    # (required by most diffusion models)
+    if 'width' in parameters:
+        width = _max(256, _min(_int(parameters['width']), {max_width!r}))
+        validated['width'] = (width // 8) * 8
+    
+    if 'height' in parameters:
+        height = _max(256, _min(_int(parameters['height']), {max_height!r}))
+        validated['height'] = (height // 8) * 8
+    
+    # Clamp steps and guidance scale
+    if 'num_inference_steps' in parameters:
+        steps = _int(parameters['num_inference_steps'])
+        validated['num_inference_steps'] = _max(
+            {min_steps!r},
+            _min(steps, {max_steps!r})
+        )
+    
+    if 'guidance_scale' in parameters:
+        guidance = _float(parameters['guidance_scale'])
+        validated['guidance_scale'] = _max(
+            {min_guidance!r},
+            _min(guidance, {max_guidance!r})
+        )
+{optional_checks}
+    return validated
+"""
+
+# Pass-through checks, only generated for models that support them
+_SEED_CHECK = """
+    if 'seed' in parameters:
+        validated['seed'] = _int(parameters['seed'])
+"""
+
+_NEGATIVE_PROMPT_CHECK = """
+    if 'negative_prompt' in parameters:
+        validated['negative_prompt'] = _str(parameters['negative_prompt'])
+"""
+
+
+def _build_parameter_validator(model: Mapping) -> Callable[[Dict], Dict]:
+    """
+    Build a parameter validator specialized for one model.
+    
+    Responsibility: ONLY generate a validator with the model's bounds inlined
+    
+    Args:
+        model (Mapping): Model configuration from the registry
+    
+    Returns:
+        Callable[[Dict], Dict]: Function that validates and clamps parameters
+    
+    Note:
+        The registry is static, so each model gets its own function
+        with its bounds written into the source as constants. Checks
+        for unsupported parameters (seed, negative prompt) are left out
+        entirely rather than tested on every call. Builtins are bound
+        as globals of the generated function to skip builtin lookups.
+    """
+    optional_checks = ''
+    if model['supports_seed']:
+        optional_checks += _SEED_CHECK
+    if model['supports_negative_prompt']:
+        optional_checks += _NEGATIVE_PROMPT_CHECK
+    
+    source = _VALIDATOR_TEMPLATE.format(
+        max_width=model['max_width'],
+        max_height=model['max_height'],
+        min_steps=model['min_steps'],
+        max_steps=model['max_steps'],
+        min_guidance=model['min_guidance'],
+        max_guidance=model['max_guidance'],
+        optional_checks=optional_checks
+    )
+    
+    namespace = {
+        '_int': int,
+        '_float': float,
+        '_str': str,
+        '_min': min,
+        '_max': max
+    }
+    exec(compile(source, f"<validator {model['id']}>", 'exec'), namespace)
+    return namespace['validate']
+
+
+@lru_cache(maxsize=32)
+def _get_parameter_validator(model_id: str) -> Callable[[Dict], Dict]:
+    """
+    Get the compiled parameter validator for a model.
+    
+    Responsibility: ONLY build a model's validator once and reuse it
+    
+    Args:
+        model_id (str): Identifier of a model in the registry
+    
+    Returns:
+        Callable[[Dict], Dict]: Validator from _build_parameter_validator()
+    
+    Raises:
+        KeyError: If model_id is not in the registry
+    
+    Note:
+        Validators are compiled on first use instead of at import, and
+        then reused for the life of the process. Callers must check the
+        model exists first, so unknown IDs never enter the cache.
+    """
+    return _build_parameter_validator(_MODELS_BY_ID[model_id])
+
+
+def compile_parameter_validators() -> int:
+    """
+    Compile the parameter validator of every model ahead of time.
+    
+    Responsibility: ONLY populate the validator cache
+    
+    Returns:
+        int: Number of validators compiled (or already cached)
+    
+    Note:
+        Optional - validators are otherwise compiled on first use.
+        Called at startup so the first request does not pay for it.
+    """
+    for model_id in _MODEL_IDS:
+        _get_parameter_validator(model_id)
+    return len(_MODEL_IDS)
+
+
 def validate_parameters_for_model(model_id: str, parameters: Dict) -> Dict:
     """
     Validate and clamp parameters to model's supported ranges.
@@ -324,53 +619,20 @@ def validate_parameters_for_model(model_id: str, parameters: Dict) -> Dict:
     Raises:
         ValueError: If model_id is not found
     
+    Note:
+        Out-of-range values are clamped, not rejected, so a schema
+        library (e.g. Pydantic constrained fields, which reject) would
+        change the API's behavior. The per-model validators are compiled
+        once (on first use) with their bounds inlined, and validate
+        every field in one straight-line call.
+    
     Example:
         >>> params = {'width': 5000, 'steps': 5}
         >>> valid = validate_parameters_for_model('black-forest-labs/FLUX.1-dev', params)
         >>> print(valid['width'])  # Clamped to max
         2048
     """
-    model = get_model_by_id(model_id)
-    
-    if not model:
+    if model_id not in _MODELS_BY_ID:
         raise ValueError(f"Model '{model_id}' not found in registry")
     
-    validated = {}
-    
-    # Validate and clamp width
-    if 'width' in parameters:
-        width = int(parameters['width'])
-        validated['width'] = max(256, min(width, model['max_width']))
-        # Ensure multiple of 8 (required by most diffusion models)
-        validated['width'] = (validated['width'] // 8) * 8
-    
-    # Validate and clamp height
-    if 'height' in parameters:
-        height = int(parameters['height'])
-        validated['height'] = max(256, min(height, model['max_height']))
-        validated['height'] = (validated['height'] // 8) * 8
-    
-    # Validate and clamp steps
-    if 'num_inference_steps' in parameters:
-        steps = int(parameters['num_inference_steps'])
-        validated['num_inference_steps'] = max(
-            model['min_steps'],
-            min(steps, model['max_steps'])
-        )
-    
-    # Validate and clamp guidance scale
-    if 'guidance_scale' in parameters:
-        guidance = float(parameters['guidance_scale'])
-        validated['guidance_scale'] = max(
-            model['min_guidance'],
-            min(guidance, model['max_guidance'])
-        )
-    
-    # Pass through other supported parameters
-    if 'seed' in parameters and model['supports_seed']:
-        validated['seed'] = int(parameters['seed'])
-    
-    if 'negative_prompt' in parameters and model['supports_negative_prompt']:
-        validated['negative_prompt'] = str(parameters['negative_prompt'])
-    
-    return validated
+    return _get_parameter_validator(model_id)(parameters)
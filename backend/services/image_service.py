@@ -16,18 +16,177 @@ Usage:
 """
 
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import requests
 from PIL import Image
-from huggingface_hub import InferenceClient
+from huggingface_hub import InferenceClient, configure_http_backend
+from huggingface_hub.constants import ENDPOINT
+from huggingface_hub.utils import build_hf_headers, hf_raise_for_status
+from requests.adapters import HTTPAdapter
 
-from utils.image_helpers import image_to_base64, get_image_info
+from utils.image_helpers import image_to_base64, image_to_bytes
 from utils.validators import validate_prompt, validate_negative_prompt
 
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Seeded generations are deterministic, so recent results are kept
+# in memory and identical requests are answered without an API call
+RESULT_CACHE_SIZE = 64
+
+# Seconds to remember an API failure, so identical requests retried
+# during an outage fail fast instead of hitting HuggingFace again
+FAILURE_CACHE_SECONDS = 10
+
+# Prompts up to this length are interned before building cache keys
+MAX_INTERNED_PROMPT_LENGTH = 4096
+
+# Seconds to wait for a HuggingFace response (matches the Gunicorn timeout)
+API_TIMEOUT = 120
+
+# Seconds to wait for the connection test (health check) to answer
+# HfApi.whoami() sets no timeout, so test_connection() makes the call itself
+CONNECTION_TEST_TIMEOUT = 10
+
+# Threads shared by all batch requests in this process
+# Bounds the number of concurrent HuggingFace calls made for batches
+BATCH_WORKERS = 32
+
+# Output formats clients can request: mimetype and encoder options
+# PNG uses zlib level 1 instead of the default 6: several times faster
+# to encode for a modestly larger payload, which suits fresh results.
+# WEBP is several times smaller than PNG for generated images.
+# JPEG is the fastest to encode (Pillow ships libjpeg-turbo); the
+# optimize/progressive passes are left off to keep it that way.
+IMAGE_FORMATS: Dict[str, Tuple[str, Dict]] = {
+    'PNG': ('image/png', {'compress_level': 1}),
+    'WEBP': ('image/webp', {'quality': 90, 'method': 4}),
+    'JPEG': ('image/jpeg', {'quality': 85, 'optimize': False, 'progressive': False})
+}
+
+# Last formatted timestamp as (epoch second, ISO string)
+_timestamp_cache: Tuple[int, str] = (0, '')
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Create the HTTP session used for HuggingFace API calls.
+    
+    Responsibility: ONLY build a session with a keep-alive connection pool
+    
+    Returns:
+        requests.Session: Session with a pooled HTTPS adapter
+    
+    Note:
+        Called once at import; the resulting session is shared by every
+        thread and greenlet (see _HTTP_SESSION below), so connections
+        and their TLS handshakes are reused across generation requests.
+        The larger pool lets concurrent requests keep their connections
+        alive instead of opening new ones.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Route all huggingface_hub HTTP traffic through one pooled session.
+# huggingface_hub caches sessions per thread ident, and under gevent every
+# request greenlet has its own ident - a factory returning a new session
+# would give each request a fresh, never-reused (and never-closed) pool.
+_HTTP_SESSION = _create_http_session()
+configure_http_backend(backend_factory=lambda: _HTTP_SESSION)
+
+
+@lru_cache(maxsize=8)
+def _validate_api_key(api_key: str) -> None:
+    """
+    Check an API key's format, once per distinct key.
+    
+    Responsibility: ONLY validate API key format
+    
+    Args:
+        api_key (str): HuggingFace API token
+    
+    Raises:
+        ValueError: If api_key is empty
+    
+    Note:
+        Memoized so services created repeatedly with the same key
+        (e.g. per request in serverless deployments) skip the checks
+        and warn only once. Raised errors are not cached.
+    """
+    if not api_key:
+        raise ValueError("API key cannot be empty")
+    
+    if not api_key.startswith('hf_'):
+        logger.warning("API key does not start with 'hf_' - may be invalid")
+
+
+def _normalize_image_format(image_format: str) -> str:
+    """
+    Normalize and check a requested output format.
+    
+    Responsibility: ONLY map a format name to an IMAGE_FORMATS key
+    
+    Args:
+        image_format (str): Format name, any case ('png', 'JPEG', ...)
+    
+    Returns:
+        str: Upper-case key of IMAGE_FORMATS
+    
+    Raises:
+        ValueError: If the format is not supported
+    
+    Note:
+        Called before any cache lookup or API call, so an unsupported
+        format never costs a generation or lands in the failure cache.
+    """
+    normalized = image_format.upper() if isinstance(image_format, str) else image_format
+    
+    if normalized not in IMAGE_FORMATS:
+        raise ValueError(
+            f"Unsupported image format: {image_format!r} "
+            f"(supported: {', '.join(IMAGE_FORMATS)})"
+        )
+    
+    return normalized
+
+
+def current_timestamp() -> str:
+    """
+    Get the current local time as an ISO 8601 string.
+    
+    Responsibility: ONLY return a per-second memoized timestamp
+    
+    Returns:
+        str: Current time, e.g. '2024-01-15T10:30:00'
+    
+    Note:
+        Formatting only happens once per second; other calls in the same
+        second reuse the string. The cache is a single tuple, so
+        concurrent threads at worst format the same second twice.
+    """
+    global _timestamp_cache
+    
+    second = int(time.time())
+    cached_second, cached_iso = _timestamp_cache
+    
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, cached_iso)
+    
+    return cached_iso
+
 
 class ImageGenerationService:
     """
@@ -40,6 +199,17 @@ class ImageGenerationService:
         client (InferenceClient): Authenticated HuggingFace client
         api_key (str): API key for authentication
     
+    Thread Safety:
+        One instance serves every request thread, so methods must not
+        store per-request state on self. The api_key is set once in
+        __init__ and the client once on first use (under _CLIENTS_LOCK),
+        and both are only read afterwards. All HTTP traffic goes through
+        one process-wide session (_HTTP_SESSION), shared on purpose by
+        every thread and greenlet: it overrides huggingface_hub's default
+        of one session per thread, and concurrent use relies on urllib3's
+        thread-safe connection pool. The result cache, failure cache and
+        in-flight map are only touched under _cache_lock.
+    
     Example:
         service = ImageGenerationService(api_key="hf_...")
         result = service.generate_image(
@@ -50,6 +220,22 @@ class ImageGenerationService:
         )
     """
     
+    # Fixed attribute set: no per-instance __dict__, and attribute
+    # access goes through slot descriptors instead of a dict lookup
+    __slots__ = (
+        'api_key',
+        '_client',
+        '_result_cache',
+        '_failure_cache',
+        '_inflight',
+        '_cache_lock',
+        '_batch_executor'
+    )
+    
+    # HuggingFace clients shared by all instances, by API key
+    _CLIENTS: Dict[str, InferenceClient] = {}
+    _CLIENTS_LOCK = threading.Lock()
+    
     def __init__(self, api_key: str):
         """
         Initialize the image generation service.
@@ -62,16 +248,60 @@ class ImageGenerationService:
         Raises:
             ValueError: If api_key is empty or invalid
         """
-        if not api_key:
-            raise ValueError("API key cannot be empty")
-        
-        if not api_key.startswith('hf_'):
-            logger.warning("API key does not start with 'hf_' - may be invalid")
+        _validate_api_key(api_key)
         
         self.api_key = api_key
-        self.client = InferenceClient(api_key=api_key)
         
-        logger.info("ImageGenerationService initialized successfully")
+        # Set on first use (see the client property)
+        self._client: Optional[InferenceClient] = None
+        
+        # Recent seeded results and recent API failures, by request key
+        self._result_cache: OrderedDict = OrderedDict()
+        self._failure_cache: OrderedDict = OrderedDict()
+        
+        # Seeded requests currently being generated, by request key
+        self._inflight: Dict[Tuple, Future] = {}
+        
+        self._cache_lock = threading.Lock()
+        
+        # Worker threads for generate_images(), reused across batches
+        self._batch_executor = ThreadPoolExecutor(
+            max_workers=BATCH_WORKERS,
+            thread_name_prefix='generate-batch'
+        )
+        
+        logger.debug("ImageGenerationService initialized successfully")
+    
+    @property
+    def client(self) -> InferenceClient:
+        """
+        Get the HuggingFace client, creating it on first use.
+        
+        Responsibility: ONLY lazily create and return the API client
+        
+        Returns:
+            InferenceClient: Authenticated HuggingFace client
+        
+        Note:
+            Deferring creation keeps service start-up fast, and processes
+            that never generate an image never build a client. Clients
+            are shared per API key across service instances, so new
+            instances reuse an existing client; the lock makes sure
+            concurrent first requests create only one.
+        """
+        client = self._client
+        if client is None:
+            with self._CLIENTS_LOCK:
+                client = self._CLIENTS.get(self.api_key)
+                if client is None:
+                    client = InferenceClient(
+                        api_key=self.api_key,
+                        timeout=API_TIMEOUT
+                    )
+                    self._CLIENTS[self.api_key] = client
+                    logger.debug("HuggingFace client created")
+            self._client = client
+        return client
     
     def generate_image(
         self,
@@ -82,7 +312,9 @@ class ImageGenerationService:
         num_inference_steps: Optional[int] = None,
         guidance_scale: Optional[float] = None,
         negative_prompt: Optional[str] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        image_format: str = 'PNG',
+        _skip_validation: bool = False
     ) -> Dict:
         """
         Generate a single image from text prompt.
@@ -104,13 +336,24 @@ class ImageGenerationService:
             guidance_scale (Optional[float]): Prompt adherence strength
             negative_prompt (Optional[str]): What to avoid in generation
             seed (Optional[int]): Random seed for reproducibility
+            image_format (str): Output format, a key of IMAGE_FORMATS
+                (case-insensitive)
+            _skip_validation (bool): Trusted callers that already ran
+                validate_prompt/validate_negative_prompt pass True
         
         Returns:
-            Dict: Contains 'success', 'image' (base64), 'metadata'
+            Dict: Contains 'success', 'image' (base64), 'mimetype', 'metadata'
+                (or 'success' and 'error' on failure)
         
         Raises:
-            ValueError: If inputs are invalid
-            Exception: If API call fails
+            ValueError: If image_format is not supported
+        
+        Note:
+            Results of seeded requests are cached in memory, since the same
+            seed gives the same image. API failures are remembered for
+            FAILURE_CACHE_SECONDS for any request. A seeded request that
+            is identical to one still being generated waits for that
+            result instead of making its own API call.
         
         Example:
             result = service.generate_image(
@@ -121,29 +364,232 @@ class ImageGenerationService:
                 guidance_scale=7.5
             )
         """
+        image_format = _normalize_image_format(image_format)
+        
+        # Interned strings hash once and compare by identity in the
+        # cache lookups; very long prompts are left out of the intern table
+        if isinstance(model_id, str):
+            model_id = sys.intern(model_id)
+        if isinstance(prompt, str) and len(prompt) <= MAX_INTERNED_PROMPT_LENGTH:
+            prompt = sys.intern(prompt)
+        
+        cache_key = (
+            model_id, prompt, width, height,
+            num_inference_steps, guidance_scale, negative_prompt, seed,
+            image_format
+        )
+        
+        cached = self._get_cached_result(cache_key, seed is not None)
+        if cached is not None:
+            return cached
+        
+        generate_kwargs = dict(
+            prompt=prompt,
+            model_id=model_id,
+            width=width,
+            height=height,
+            num_inference_steps=num_inference_steps,
+            guidance_scale=guidance_scale,
+            negative_prompt=negative_prompt,
+            seed=seed,
+            image_format=image_format,
+            skip_validation=_skip_validation
+        )
+        
+        # Unseeded requests give a different image each time - never share
+        if seed is None:
+            return self._generate_and_remember(cache_key, **generate_kwargs)
+        
+        future, is_leader = self._join_inflight(cache_key)
+        if not is_leader:
+            logger.info("Waiting for identical in-flight request")
+            return future.result()
+        
         try:
-            # Step 1: Validate inputs
-            # This ensures bad data never reaches the API
-            logger.info(f"Validating generation request for model: {model_id}")
-            self._validate_generation_inputs(prompt, negative_prompt)
-            
-            # Step 2: Build parameters dictionary
-            # Only include parameters that are actually set
-            params = self._build_generation_params(
+            result = self._generate_and_remember(cache_key, **generate_kwargs)
+            future.set_result(result)
+            return result
+        
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        
+        finally:
+            with self._cache_lock:
+                del self._inflight[cache_key]
+    
+    def generate_image_bytes(
+        self,
+        prompt: str,
+        model_id: str,
+        width: int = 768,
+        height: int = 768,
+        num_inference_steps: Optional[int] = None,
+        guidance_scale: Optional[float] = None,
+        negative_prompt: Optional[str] = None,
+        seed: Optional[int] = None,
+        image_format: str = 'PNG',
+        _skip_validation: bool = False
+    ) -> Dict:
+        """
+        Generate a single image and return it as raw image bytes.
+        
+        Responsibility: ONLY orchestrate generation for binary responses
+        
+        Same as generate_image(), but skips base64 encoding so the image
+        can be sent as-is in an image response.
+        
+        Args:
+            prompt (str): Text description of desired image
+            model_id (str): HuggingFace model identifier
+            width (int): Image width in pixels
+            height (int): Image height in pixels
+            num_inference_steps (Optional[int]): Number of denoising steps
+            guidance_scale (Optional[float]): Prompt adherence strength
+            negative_prompt (Optional[str]): What to avoid in generation
+            seed (Optional[int]): Random seed for reproducibility
+            image_format (str): Output format, a key of IMAGE_FORMATS
+                (case-insensitive)
+            _skip_validation (bool): Trusted callers that already ran
+                validate_prompt/validate_negative_prompt pass True
+        
+        Returns:
+            Dict: Contains 'success', 'image_bytes', 'mimetype', 'metadata'
+                (or 'success' and 'error' on failure)
+        
+        Raises:
+            ValueError: If image_format is not supported
+        """
+        image_format = _normalize_image_format(image_format)
+        
+        try:
+            image, params = self._create_image(
+                prompt=prompt,
+                model_id=model_id,
                 width=width,
                 height=height,
                 num_inference_steps=num_inference_steps,
                 guidance_scale=guidance_scale,
                 negative_prompt=negative_prompt,
-                seed=seed
+                seed=seed,
+                skip_validation=_skip_validation
             )
             
-            # Step 3: Call HuggingFace API
-            logger.info(f"Calling HuggingFace API with prompt: '{prompt[:50]}...'")
-            image = self._call_api(prompt, model_id, params)
+            mimetype, save_options = IMAGE_FORMATS[image_format]
+            
+            logger.info("Image generated successfully")
+            return {
+                'success': True,
+                'image_bytes': image_to_bytes(image, image_format, **save_options),
+                'mimetype': mimetype,
+                'metadata': self._build_metadata(image, model_id, prompt, params)
+            }
+        
+        except Exception as e:
+            logger.error(f"Image generation failed: {str(e)}")
+            return self._format_error_response(str(e))
+    
+    def generate_images(self, batch: List[Dict]) -> List[Dict]:
+        """
+        Generate several images concurrently.
+        
+        Responsibility: ONLY fan a batch out to generate_image()
+        
+        Args:
+            batch (List[Dict]): Keyword arguments for generate_image(),
+                one dict per image
+        
+        Returns:
+            List[Dict]: One result per entry, in the same order
+        
+        Note:
+            The HuggingFace API has no batched text-to-image call, so each
+            image is its own API call. Running them concurrently means the
+            batch takes about as long as its slowest image. The threads
+            are shared across batches instead of started per batch.
+        
+        Example:
+            results = service.generate_images([
+                {'prompt': 'A red car', 'model_id': 'black-forest-labs/FLUX.1-dev'},
+                {'prompt': 'A blue car', 'model_id': 'black-forest-labs/FLUX.1-dev'}
+            ])
+        """
+        if not batch:
+            return []
+        
+        logger.info(f"Generating batch of {len(batch)} images")
+        
+        # generate_image() only raises for an unsupported image_format
+        # (checked before any API call); other errors come back as dicts
+        return list(self._batch_executor.map(
+            lambda kwargs: self.generate_image(**kwargs),
+            batch
+        ))
+    
+    def _join_inflight(self, key: Tuple) -> Tuple[Future, bool]:
+        """
+        Register a request as in flight, or join an identical one.
+        
+        Responsibility: ONLY coalesce identical concurrent requests
+        
+        Args:
+            key (Tuple): Request key built by generate_image()
+        
+        Returns:
+            Tuple[Future, bool]: Future for the result, and True if the
+                caller must generate it (and later resolve the future)
+        """
+        with self._cache_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+    
+    def _generate_and_remember(
+        self,
+        cache_key: Tuple,
+        prompt: str,
+        model_id: str,
+        width: int,
+        height: int,
+        num_inference_steps: Optional[int],
+        guidance_scale: Optional[float],
+        negative_prompt: Optional[str],
+        seed: Optional[int],
+        image_format: str,
+        skip_validation: bool
+    ) -> Dict:
+        """
+        Generate an image and record the outcome in the caches.
+        
+        Responsibility: ONLY run generation and cache its result or failure
+        
+        Returns:
+            Dict: Success or error response (never raises)
+        """
+        try:
+            image, params = self._create_image(
+                prompt=prompt,
+                model_id=model_id,
+                width=width,
+                height=height,
+                num_inference_steps=num_inference_steps,
+                guidance_scale=guidance_scale,
+                negative_prompt=negative_prompt,
+                seed=seed,
+                skip_validation=skip_validation
+            )
             
             # Step 4: Process and format response
-            result = self._format_success_response(image, model_id, prompt, params)
+            result = self._format_success_response(
+                image, model_id, prompt, params, image_format
+            )
+            
+            if seed is not None:
+                self._store_result(cache_key, result)
             
             logger.info("Image generated successfully")
             return result
@@ -151,8 +597,144 @@ class ImageGenerationService:
         except Exception as e:
             # Handle any errors that occurred
             logger.error(f"Image generation failed: {str(e)}")
+            
+            # Invalid input is cheap to reject again - only remember API failures
+            if not isinstance(e, ValueError):
+                self._store_failure(cache_key, str(e))
+            
             return self._format_error_response(str(e))
     
+    def _get_cached_result(
+        self,
+        key: Tuple,
+        use_results: bool
+    ) -> Optional[Dict]:
+        """
+        Look up a request in the result and failure caches.
+        
+        Responsibility: ONLY answer a request from memory if possible
+        
+        Args:
+            key (Tuple): Request key built by generate_image()
+            use_results (bool): Whether cached results may be used
+                (only for seeded, deterministic requests)
+        
+        Returns:
+            Optional[Dict]: Response to return, or None to generate
+        
+        Note:
+            Cached results get a fresh timestamp; the cached dict
+            itself is never handed out.
+        """
+        with self._cache_lock:
+            failure = self._failure_cache.get(key)
+            if failure is not None:
+                failed_at, error_message = failure
+                if time.monotonic() - failed_at < FAILURE_CACHE_SECONDS:
+                    logger.warning("Returning recent failure for identical request")
+                    return self._format_error_response(error_message)
+                del self._failure_cache[key]
+            
+            if not use_results:
+                return None
+            
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            
+            self._result_cache.move_to_end(key)
+        
+        logger.info("Returning cached image for identical seeded request")
+        metadata = dict(result['metadata'])
+        metadata['timestamp'] = current_timestamp()
+        return {**result, 'metadata': metadata}
+    
+    def _store_result(self, key: Tuple, result: Dict) -> None:
+        """
+        Remember a successful result, evicting the least recently used.
+        
+        Responsibility: ONLY write to the result cache
+        
+        Args:
+            key (Tuple): Request key built by generate_image()
+            result (Dict): Successful generation response
+        """
+        with self._cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _store_failure(self, key: Tuple, error_message: str) -> None:
+        """
+        Remember an API failure for FAILURE_CACHE_SECONDS.
+        
+        Responsibility: ONLY write to the failure cache
+        
+        Args:
+            key (Tuple): Request key built by generate_image()
+            error_message (str): Error to return for identical requests
+        """
+        with self._cache_lock:
+            self._failure_cache[key] = (time.monotonic(), error_message)
+            self._failure_cache.move_to_end(key)
+            if len(self._failure_cache) > RESULT_CACHE_SIZE:
+                self._failure_cache.popitem(last=False)
+    
+    def _create_image(
+        self,
+        prompt: str,
+        model_id: str,
+        width: int,
+        height: int,
+        num_inference_steps: Optional[int],
+        guidance_scale: Optional[float],
+        negative_prompt: Optional[str],
+        seed: Optional[int],
+        skip_validation: bool = False
+    ) -> Tuple[Image.Image, Dict]:
+        """
+        Validate inputs and call the API to produce an image.
+        
+        Responsibility: ONLY run steps 1-3 of generation (validate, build, call)
+        
+        Note:
+            Step 1 is skipped when skip_validation is True, for callers
+            that already validated the prompts.
+        
+        Returns:
+            Tuple[Image.Image, Dict]: Generated image and parameters used
+        
+        Raises:
+            ValueError: If inputs are invalid
+            Exception: If API call fails
+        """
+        # Step 1: Validate inputs
+        # This ensures bad data never reaches the API
+        if not skip_validation:
+            # Guarded so the message is not formatted when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Validating generation request for model: {model_id}")
+            self._validate_generation_inputs(prompt, negative_prompt)
+        
+        # Step 2: Build parameters dictionary
+        # Only include parameters that are actually set
+        params = self._build_generation_params(
+            width=width,
+            height=height,
+            num_inference_steps=num_inference_steps,
+            guidance_scale=guidance_scale,
+            negative_prompt=negative_prompt,
+            seed=seed
+        )
+        
+        # Step 3: Call HuggingFace API
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Calling HuggingFace API with prompt: '{prompt[:50]}...'")
+        image = self._call_api(prompt, model_id, params)
+        
+        return image, params
+    
     def _validate_generation_inputs(
         self,
         prompt: str,
@@ -205,26 +787,30 @@ class ImageGenerationService:
         Note:
             Only includes non-None parameters to avoid API errors
         """
-        params = {
-            'width': width,
-            'height': height
-        }
+        # Common case: only the size is set
+        if (
+            num_inference_steps is None
+            and guidance_scale is None
+            and not negative_prompt
+            and seed is None
+        ):
+            return {'width': width, 'height': height}
         
         # Only add optional parameters if they are provided
         # This prevents sending None values to the API
-        if num_inference_steps is not None:
-            params['num_inference_steps'] = num_inference_steps
-        
-        if guidance_scale is not None:
-            params['guidance_scale'] = guidance_scale
-        
-        if negative_prompt:
-            params['negative_prompt'] = negative_prompt
-        
-        if seed is not None:
-            params['seed'] = seed
+        # (an empty negative prompt counts as not provided)
+        optional = (
+            ('num_inference_steps', num_inference_steps),
+            ('guidance_scale', guidance_scale),
+            ('negative_prompt', negative_prompt or None),
+            ('seed', seed)
+        )
         
-        return params
+        return {
+            'width': width,
+            'height': height,
+            **{key: value for key, value in optional if value is not None}
+        }
     
     def _call_api(
         self,
@@ -268,7 +854,8 @@ class ImageGenerationService:
         image: Image.Image,
         model_id: str,
         prompt: str,
-        params: Dict
+        params: Dict,
+        image_format: str = 'PNG'
     ) -> Dict:
         """
         Format successful generation response.
@@ -280,28 +867,55 @@ class ImageGenerationService:
             model_id (str): Model that was used
             prompt (str): Prompt that was used
             params (Dict): Parameters that were used
+            image_format (str): Output format, a key of IMAGE_FORMATS
         
         Returns:
-            Dict: Formatted response with image and metadata
+            Dict: Formatted response with image, mimetype and metadata
         """
-        # Convert image to base64 for JSON transmission
-        image_base64 = image_to_base64(image)
+        mimetype, save_options = IMAGE_FORMATS[image_format]
         
-        # Extract image information
-        image_info = get_image_info(image)
+        # Convert image to base64 for JSON transmission
+        image_base64 = image_to_base64(image, image_format, **save_options)
         
         # Build response
         return {
             'success': True,
             'image': image_base64,
-            'metadata': {
-                'model_id': model_id,
-                'prompt': prompt,
-                'width': image_info['width'],
-                'height': image_info['height'],
-                'parameters': params,
-                'timestamp': datetime.now().isoformat()
-            }
+            'mimetype': mimetype,
+            'metadata': self._build_metadata(image, model_id, prompt, params)
+        }
+    
+    def _build_metadata(
+        self,
+        image: Image.Image,
+        model_id: str,
+        prompt: str,
+        params: Dict
+    ) -> Dict:
+        """
+        Build metadata describing a generated image.
+        
+        Responsibility: ONLY assemble generation metadata
+        
+        Args:
+            image (Image.Image): Generated image
+            model_id (str): Model that was used
+            prompt (str): Prompt that was used
+            params (Dict): Parameters that were used
+        
+        Returns:
+            Dict: Metadata (model, prompt, size, parameters, timestamp)
+        """
+        # Only the size is needed, read straight from the image
+        width, height = image.size
+        
+        return {
+            'model_id': model_id,
+            'prompt': prompt,
+            'width': width,
+            'height': height,
+            'parameters': params,
+            'timestamp': current_timestamp()
         }
     
     def _format_error_response(self, error_message: str) -> Dict:
@@ -319,7 +933,7 @@ class ImageGenerationService:
         return {
             'success': False,
             'error': error_message,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': current_timestamp()
         }
     
     def test_connection(self) -> bool:
@@ -331,19 +945,25 @@ class ImageGenerationService:
         Returns:
             bool: True if connection works, False otherwise
         
+        Note:
+            Uses the whoami endpoint, which checks both reachability and
+            the token without generating an image (no GPU time or quota).
+            It goes through the same pooled HTTP session as generation,
+            with a CONNECTION_TEST_TIMEOUT so a stalled probe cannot hang
+            the health check worker.
+        
         Example:
             if service.test_connection():
                 print("API is ready!")
         """
         try:
-            # Try a minimal API call to test connection
-            # Using a small, fast model for testing
-            test_image = self.client.text_to_image(
-                prompt="test",
-                model="black-forest-labs/FLUX.1-dev",
-                width=256,
-                height=256
+            # Cheap authenticated metadata call (what HfApi.whoami() sends)
+            response = _HTTP_SESSION.get(
+                f"{ENDPOINT}/api/whoami-v2",
+                headers=build_hf_headers(token=self.api_key),
+                timeout=CONNECTION_TEST_TIMEOUT
             )
+            hf_raise_for_status(response)
             logger.info("API connection test successful")
             return True
         
@@ -15,13 +15,20 @@ Usage:
 """
 
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from models.models_config import (
+    compile_parameter_validators,
     get_all_models,
+    get_all_tags,
+    get_catalog_version,
     get_model_by_id,
     get_models_by_category,
     get_models_by_tag,
+    get_model_counts_by_category,
+    get_model_counts_by_provider,
     is_valid_model_id,
     get_default_parameters_for_model,
     validate_parameters_for_model
@@ -29,8 +36,169 @@ from models.models_config import (
 
 
 # Configure logging for this module
+# Messages use %-style arguments: these methods run on every request, and
+# logging only formats the message if the level is actually enabled
 logger = logging.getLogger(__name__)
 
+# Requests with a longer negative prompt skip the validation cache,
+# keeping cache entries small
+MAX_CACHED_NEGATIVE_PROMPT_LENGTH = 200
+
+
+@lru_cache(maxsize=1)
+def _cached_model_summary(catalog_version: int) -> Mapping:
+    """
+    Build the model summary once per catalog version.
+    
+    Responsibility: ONLY compute and memoize model statistics
+    
+    Args:
+        catalog_version (int): Version from get_catalog_version(),
+            used only as the cache key
+    
+    Returns:
+        Mapping: Read-only summary with counts by category, provider, tags
+    
+    Note:
+        The catalog is static config frozen at import, so in practice
+        the summary is computed once per process.
+    """
+    # Counts and tags come straight from the registry indexes, which are
+    # built in a single pass over the models at import - no loop here
+    categories = get_model_counts_by_category()
+    providers = get_model_counts_by_provider()
+    
+    return MappingProxyType({
+        'total_models': len(get_all_models()),
+        'categories': MappingProxyType(categories),
+        'providers': MappingProxyType(providers),
+        'unique_tags': get_all_tags()
+    })
+
+
+@lru_cache(maxsize=1)
+def _cached_models_for_ui(catalog_version: int) -> Tuple[Mapping, ...]:
+    """
+    Build the UI model list once per catalog version.
+    
+    Responsibility: ONLY compute and memoize the UI projection
+    
+    Args:
+        catalog_version (int): Version from get_catalog_version(),
+            used only as the cache key
+    
+    Returns:
+        Tuple[Mapping, ...]: Read-only simplified models
+    """
+    # Extract only fields needed by UI
+    return tuple(
+        MappingProxyType({
+            'id': model['id'],
+            'name': model['name'],
+            'description': model['description'],
+            'category': model['category'],
+            'estimated_time': model['estimated_time'],
+            'tags': model['tags'],
+            'default_params': MappingProxyType({
+                'width': model['default_width'],
+                'height': model['default_height'],
+                'steps': model['default_steps'],
+                'guidance': model['default_guidance']
+            })
+        })
+        for model in get_all_models()
+    )
+
+
+@lru_cache(maxsize=1024)
+def _cached_validated_parameters(
+    model_id: str,
+    key_params: Tuple[Tuple[str, object], ...]
+) -> Mapping:
+    """
+    Validate a parameter set, computed once per distinct set.
+    
+    Responsibility: ONLY memoize parameter validation
+    
+    Args:
+        model_id (str): Model identifier
+        key_params (Tuple): Parameters as sorted (name, value) pairs
+    
+    Returns:
+        Mapping: Read-only validated parameters
+    
+    Raises:
+        ValueError: If model_id is not found
+    
+    Note:
+        Most requests use the same defaults (width, height, steps),
+        so the common case becomes a cache lookup. Failed validations
+        raise and are not cached.
+    """
+    return MappingProxyType(
+        validate_parameters_for_model(model_id, dict(key_params))
+    )
+
+
+def _make_parameters_key(
+    parameters: Dict
+) -> Optional[Tuple[Tuple[str, object], ...]]:
+    """
+    Build a hashable cache key for a parameter set.
+    
+    Responsibility: ONLY turn parameters into a cache key
+    
+    Args:
+        parameters (Dict): Parameters to validate
+    
+    Returns:
+        Optional[Tuple]: Sorted (name, value) pairs, or None if the
+            parameters should not be cached
+    """
+    negative_prompt = parameters.get('negative_prompt')
+    if (
+        isinstance(negative_prompt, str)
+        and len(negative_prompt) > MAX_CACHED_NEGATIVE_PROMPT_LENGTH
+    ):
+        return None
+    
+    key_params = tuple(sorted(parameters.items()))
+    
+    # Values come from request JSON and may be lists or dicts
+    try:
+        hash(key_params)
+    except TypeError:
+        return None
+    
+    return key_params
+
+
+@lru_cache(maxsize=1)
+def _cached_search_blobs(catalog_version: int) -> Tuple[Tuple[str, Mapping], ...]:
+    """
+    Build lowercased search text for every model, once per catalog version.
+    
+    Responsibility: ONLY precompute searchable text for each model
+    
+    Args:
+        catalog_version (int): Version from get_catalog_version(),
+            used only as the cache key
+    
+    Returns:
+        Tuple[Tuple[str, Mapping], ...]: (search text, model) pairs
+    
+    Note:
+        Name, description and tags are joined with NUL separators, so a
+        query can match inside any one field but never across two.
+    """
+    return tuple(
+        (
+            '\0'.join((model['name'], model['description'], *model['tags'])).lower(),
+            model
+        )
+        for model in get_all_models()
+    )
+
 
 class ModelService:
     """
@@ -53,14 +221,14 @@ class ModelService:
         """
         logger.info("ModelService initialized successfully")
     
-    def get_available_models(self) -> List[Dict]:
+    def get_available_models(self) -> Tuple[Mapping, ...]:
         """
         Get list of all available models.
         
         Responsibility: ONLY retrieve and return available models
         
         Returns:
-            List[Dict]: List of all model configurations
+            Tuple[Mapping, ...]: Read-only model configurations
         
         Example:
             >>> service = ModelService()
@@ -69,10 +237,10 @@ class ModelService:
         """
         logger.debug("Retrieving all available models")
         models = get_all_models()
-        logger.info(f"Retrieved {len(models)} available models")
+        logger.info("Retrieved %d available models", len(models))
         return models
     
-    def get_model_details(self, model_id: str) -> Optional[Dict]:
+    def get_model_details(self, model_id: str) -> Optional[Mapping]:
         """
         Get detailed information about a specific model.
         
@@ -82,7 +250,7 @@ class ModelService:
             model_id (str): Model identifier
         
         Returns:
-            Optional[Dict]: Model details if found, None otherwise
+            Optional[Mapping]: Read-only model details if found, None otherwise
         
         Example:
             >>> service = ModelService()
@@ -90,17 +258,17 @@ class ModelService:
             >>> print(model['name'])
             FLUX.1 Dev
         """
-        logger.debug(f"Retrieving details for model: {model_id}")
+        logger.debug("Retrieving details for model: %s", model_id)
         model = get_model_by_id(model_id)
         
         if model:
-            logger.info(f"Found model: {model['name']}")
+            logger.info("Found model: %s", model['name'])
         else:
-            logger.warning(f"Model not found: {model_id}")
+            logger.warning("Model not found: %s", model_id)
         
         return model
     
-    def get_models_by_category(self, category: str) -> List[Dict]:
+    def get_models_by_category(self, category: str) -> Tuple[Mapping, ...]:
         """
         Get models filtered by category.
         
@@ -110,18 +278,18 @@ class ModelService:
             category (str): Category name ('general', 'fast', 'artistic', etc.)
         
         Returns:
-            List[Dict]: Models in the specified category
+            Tuple[Mapping, ...]: Read-only models in the specified category
         
         Example:
             >>> service = ModelService()
             >>> fast_models = service.get_models_by_category('fast')
         """
-        logger.debug(f"Retrieving models in category: {category}")
+        logger.debug("Retrieving models in category: %s", category)
         models = get_models_by_category(category)
-        logger.info(f"Found {len(models)} models in category '{category}'")
+        logger.info("Found %d models in category '%s'", len(models), category)
         return models
     
-    def get_models_by_tag(self, tag: str) -> List[Dict]:
+    def get_models_by_tag(self, tag: str) -> Tuple[Mapping, ...]:
         """
         Get models filtered by tag.
         
@@ -131,15 +299,15 @@ class ModelService:
             tag (str): Tag name ('realistic', 'fast', 'artistic', etc.)
         
         Returns:
-            List[Dict]: Models with the specified tag
+            Tuple[Mapping, ...]: Read-only models with the specified tag
         
         Example:
             >>> service = ModelService()
             >>> realistic = service.get_models_by_tag('realistic')
         """
-        logger.debug(f"Retrieving models with tag: {tag}")
+        logger.debug("Retrieving models with tag: %s", tag)
         models = get_models_by_tag(tag)
-        logger.info(f"Found {len(models)} models with tag '{tag}'")
+        logger.info("Found %d models with tag '%s'", len(models), tag)
         return models
     
     def validate_model_id(self, model_id: str) -> bool:
@@ -163,9 +331,9 @@ class ModelService:
         is_valid = is_valid_model_id(model_id)
         
         if is_valid:
-            logger.debug(f"Model ID validated: {model_id}")
+            logger.debug("Model ID validated: %s", model_id)
         else:
-            logger.warning(f"Invalid model ID: {model_id}")
+            logger.warning("Invalid model ID: %s", model_id)
         
         return is_valid
     
@@ -190,15 +358,15 @@ class ModelService:
             >>> print(params['width'])
             768
         """
-        logger.debug(f"Getting default parameters for: {model_id}")
+        logger.debug("Getting default parameters for: %s", model_id)
         
         try:
             params = get_default_parameters_for_model(model_id)
-            logger.info(f"Retrieved default parameters for {model_id}")
+            logger.info("Retrieved default parameters for %s", model_id)
             return params
         
         except ValueError as e:
-            logger.error(f"Failed to get default parameters: {str(e)}")
+            logger.error("Failed to get default parameters: %s", e)
             raise
     
     def validate_and_prepare_parameters(
@@ -221,6 +389,10 @@ class ModelService:
         Raises:
             ValueError: If model_id is not found
         
+        Note:
+            Results are memoized per (model_id, parameters), except for
+            unhashable values or long negative prompts.
+        
         Example:
             >>> service = ModelService()
             >>> params = {'width': 5000, 'steps': 5}
@@ -229,25 +401,38 @@ class ModelService:
             ...     params
             ... )
         """
-        logger.debug(f"Validating parameters for model: {model_id}")
+        logger.debug("Validating parameters for model: %s", model_id)
         
         try:
-            validated = validate_parameters_for_model(model_id, parameters)
-            logger.info(f"Parameters validated for {model_id}")
+            key_params = _make_parameters_key(parameters)
+            
+            if key_params is None:
+                validated = validate_parameters_for_model(model_id, parameters)
+            else:
+                # Copy so callers can modify their result freely
+                validated = dict(
+                    _cached_validated_parameters(model_id, key_params)
+                )
+            
+            logger.info("Parameters validated for %s", model_id)
             return validated
         
         except ValueError as e:
-            logger.error(f"Parameter validation failed: {str(e)}")
+            logger.error("Parameter validation failed: %s", e)
             raise
     
-    def get_model_summary(self) -> Dict:
+    def get_model_summary(self) -> Mapping:
         """
         Get summary statistics about available models.
         
         Responsibility: ONLY calculate and return model statistics
         
         Returns:
-            Dict: Summary with counts by category, tags, etc.
+            Mapping: Read-only summary with counts by category, tags, etc.
+        
+        Note:
+            The summary is computed once and shared, so it is returned
+            as a read-only mapping.
         
         Example:
             >>> service = ModelService()
@@ -255,49 +440,30 @@ class ModelService:
             >>> print(summary['total_models'])
             5
         """
-        logger.debug("Generating model summary")
+        logger.debug("Getting model summary")
         
-        models = get_all_models()
+        summary = _cached_model_summary(get_catalog_version())
         
-        # Count models by category
-        categories = {}
-        for model in models:
-            cat = model['category']
-            categories[cat] = categories.get(cat, 0) + 1
-        
-        # Count models by provider
-        providers = {}
-        for model in models:
-            prov = model['provider']
-            providers[prov] = providers.get(prov, 0) + 1
-        
-        # Collect all unique tags
-        all_tags = set()
-        for model in models:
-            all_tags.update(model['tags'])
-        
-        summary = {
-            'total_models': len(models),
-            'categories': categories,
-            'providers': providers,
-            'unique_tags': sorted(list(all_tags))
-        }
-        
-        logger.info(f"Generated summary for {summary['total_models']} models")
+        logger.info("Generated summary for %d models", summary['total_models'])
         return summary
     
-    def get_models_for_ui(self) -> List[Dict]:
+    def get_models_for_ui(self) -> Tuple[Mapping, ...]:
         """
         Get simplified model list optimized for UI display.
         
         Responsibility: ONLY format models for frontend consumption
         
         Returns:
-            List[Dict]: Simplified model list with essential info
+            Tuple[Mapping, ...]: Read-only simplified models with essential info
         
         Note:
             This returns only the fields needed by the UI,
-            reducing payload size and complexity.
+            reducing payload size and complexity. The list is built
+            once per catalog version and shared.
+            
+            /api/models?ui=true does not serialize this per request:
+            app.py encodes the full response body (with orjson) once at
+            startup and serves those bytes, so no bytes variant is kept here.
         
         Example:
             >>> service = ModelService()
@@ -305,30 +471,36 @@ class ModelService:
         """
         logger.debug("Preparing models for UI")
         
-        models = get_all_models()
-        
-        # Extract only fields needed by UI
-        ui_models = []
-        for model in models:
-            ui_models.append({
-                'id': model['id'],
-                'name': model['name'],
-                'description': model['description'],
-                'category': model['category'],
-                'estimated_time': model['estimated_time'],
-                'tags': model['tags'],
-                'default_params': {
-                    'width': model['default_width'],
-                    'height': model['default_height'],
-                    'steps': model['default_steps'],
-                    'guidance': model['default_guidance']
-                }
-            })
+        ui_models = _cached_models_for_ui(get_catalog_version())
         
-        logger.info(f"Prepared {len(ui_models)} models for UI")
+        logger.info("Prepared %d models for UI", len(ui_models))
         return ui_models
     
-    def search_models(self, query: str) -> List[Dict]:
+    def warmup(self) -> None:
+        """
+        Populate all model caches before the first request.
+        
+        Responsibility: ONLY build cached model data ahead of time
+        
+        Note:
+            Everything here is otherwise built lazily on first use;
+            calling this at startup moves that cost out of the first
+            user request. Safe to call more than once.
+        
+        Example:
+            >>> service = ModelService()
+            >>> service.warmup()
+        """
+        version = get_catalog_version()
+        
+        _cached_model_summary(version)
+        _cached_models_for_ui(version)
+        _cached_search_blobs(version)
+        validators = compile_parameter_validators()
+        
+        logger.info("Model caches warmed (%d validators compiled)", validators)
+    
+    def search_models(self, query: str) -> List[Mapping]:
         """
         Search models by name, description, or tags.
         
@@ -338,36 +510,25 @@ class ModelService:
             query (str): Search query
         
         Returns:
-            List[Dict]: Models matching the search query
+            List[Mapping]: Read-only models matching the search query
         
         Example:
             >>> service = ModelService()
             >>> results = service.search_models('fast')
         """
-        logger.debug(f"Searching models with query: {query}")
+        logger.debug("Searching models with query: %s", query)
         
         if not query:
-            return get_all_models()
+            return list(get_all_models())
         
         query_lower = query.lower()
-        models = get_all_models()
-        results = []
         
-        for model in models:
-            # Search in name
-            if query_lower in model['name'].lower():
-                results.append(model)
-                continue
-            
-            # Search in description
-            if query_lower in model['description'].lower():
-                results.append(model)
-                continue
-            
-            # Search in tags
-            if any(query_lower in tag.lower() for tag in model['tags']):
-                results.append(model)
-                continue
+        # One substring test per model against its name, description and tags
+        results = [
+            model
+            for text, model in _cached_search_blobs(get_catalog_version())
+            if query_lower in text
+        ]
         
-        logger.info(f"Found {len(results)} models matching '{query}'")
+        logger.info("Found %d models matching '%s'", len(results), query)
         return results
@@ -9,6 +9,7 @@ from .validators import (
     validate_model_id
 )
 from .image_helpers import (
+    image_to_bytes,
     image_to_base64,
     base64_to_image,
     resize_image,
@@ -25,6 +26,7 @@ __all__ = [
     'validate_guidance_scale',
     'validate_seed',
     'validate_model_id',
+    'image_to_bytes',
     'image_to_base64',
     'base64_to_image',
     'resize_image',
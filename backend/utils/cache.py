@@ -0,0 +1,162 @@
+"""
+Generation Cache Module
+
+This module provides a Redis-backed cache for generation results: with
+a fixed seed, the same request produces the same image, so a repeat
+request can skip the HuggingFace call entirely. The stored value is the
+serialized JSON response body, shared by all workers.
+
+The model catalog routes are not cached here: they are served from
+in-process data, which is cheaper than a Redis round trip.
+
+Caching is optional: if no Redis URL is configured, or Redis cannot be
+reached, generation simply runs as normal.
+
+Usage:
+    from utils.cache import init_cache, make_generation_key
+    
+    init_cache(config.REDIS_URL)
+    
+    key = make_generation_key(prompt, model_id, params)
+    body = get_cached_generation(key)
+"""
+
+import hashlib
+import logging
+from typing import Dict, Optional
+
+import orjson
+import redis
+
+
+# Configure logging for this module
+logger = logging.getLogger(__name__)
+
+# Shared Redis client, set once by init_cache()
+# None means caching is disabled
+_redis_client: Optional[redis.Redis] = None
+
+# Key prefix so generation entries are easy to find and flush
+GENERATION_KEY_PREFIX = 'img:'
+
+
+def init_cache(redis_url: str) -> bool:
+    """
+    Connect the generation cache to Redis.
+    
+    Responsibility: ONLY create and verify the shared Redis client
+    
+    Args:
+        redis_url (str): Redis connection URL (e.g. redis://localhost:6379/0)
+    
+    Returns:
+        bool: True if caching is enabled, False otherwise
+    
+    Note:
+        An empty URL or an unreachable server disables caching
+        instead of failing, so local development works without Redis.
+    """
+    global _redis_client
+    
+    if not redis_url:
+        logger.info("REDIS_URL not set - generation cache disabled")
+        _redis_client = None
+        return False
+    
+    try:
+        client = redis.Redis.from_url(redis_url)
+        client.ping()
+    except redis.RedisError as e:
+        logger.warning(f"Redis unavailable - generation cache disabled: {str(e)}")
+        _redis_client = None
+        return False
+    
+    _redis_client = client
+    logger.info("Generation cache connected to Redis")
+    return True
+
+
+def get_cache_client() -> Optional[redis.Redis]:
+    """
+    Get the shared Redis client.
+    
+    Responsibility: ONLY return the configured client
+    
+    Returns:
+        Optional[redis.Redis]: Redis client, or None if caching is disabled
+    """
+    return _redis_client
+
+
+def make_generation_key(prompt: str, model_id: str, params: Dict) -> str:
+    """
+    Build the cache key for a generation request.
+    
+    Responsibility: ONLY derive a stable key from generation inputs
+    
+    Args:
+        prompt (str): Text prompt
+        model_id (str): Model identifier
+        params (Dict): Validated generation parameters
+    
+    Returns:
+        str: Redis key for the generation result
+    
+    Note:
+        Keys are sorted before hashing so parameter order does not matter.
+    """
+    normalized = orjson.dumps(
+        {'prompt': prompt, 'model_id': model_id, **params},
+        option=orjson.OPT_SORT_KEYS
+    )
+    return f"{GENERATION_KEY_PREFIX}{hashlib.sha256(normalized).hexdigest()}"
+
+
+def get_cached_generation(key: str) -> Optional[bytes]:
+    """
+    Get a cached generation response body.
+    
+    Responsibility: ONLY read a generation result from Redis
+    
+    Args:
+        key (str): Key from make_generation_key()
+    
+    Returns:
+        Optional[bytes]: Cached JSON body, or None on miss or if disabled
+    """
+    client = _redis_client
+    if client is None:
+        return None
+    
+    try:
+        return client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Generation cache read failed: {str(e)}")
+        return None
+
+
+def set_cached_generation(key: str, body: bytes, ttl: int) -> bool:
+    """
+    Store a generation response body.
+    
+    Responsibility: ONLY write a generation result to Redis
+    
+    Args:
+        key (str): Key from make_generation_key()
+        body (bytes): Serialized JSON response
+        ttl (int): Time to live in seconds
+    
+    Returns:
+        bool: True if stored, False if caching is disabled or Redis failed
+    """
+    client = _redis_client
+    if client is None:
+        return False
+    
+    try:
+        client.setex(key, ttl, body)
+    except redis.RedisError as e:
+        logger.warning(f"Generation cache write failed: {str(e)}")
+        return False
+    
+    return True
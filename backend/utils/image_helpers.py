@@ -6,6 +6,10 @@ including conversion, encoding, and basic manipulations.
 
 Each function has a single responsibility following SOLID principles.
 
+Base64 uses pybase64, which uses SIMD instructions, since every
+generated image is base64-encoded. If it is not installed, the standard
+library base64 module is used instead (same output, slower).
+
 Usage:
     from utils.image_helpers import image_to_base64, base64_to_image
     
@@ -13,48 +17,144 @@ Usage:
     pil_image = base64_to_image(base64_str)
 """
 
-import base64
+import weakref
+from functools import lru_cache
 from io import BytesIO
-from typing import Union
+from typing import Dict, Optional, Tuple, Union
 from PIL import Image
 
+try:
+    from pybase64 import b64decode, b64encode_as_string
+except ImportError:
+    from base64 import b64decode, b64encode
+    
+    def b64encode_as_string(data) -> str:
+        """Encode bytes-like data to a base64 str (stdlib fallback)."""
+        return b64encode(data).decode('ascii')
+
 
-def image_to_base64(image: Image.Image, format: str = 'PNG') -> str:
+def _prepare_for_format(image: Image.Image, format: str) -> Image.Image:
     """
-    Convert PIL Image to base64 string.
+    Convert an image to a mode the target format can store.
     
-    Responsibility: ONLY convert PIL Image to base64 encoding
+    Responsibility: ONLY make the image mode compatible with the format
     
     Args:
         image (Image.Image): PIL Image object
         format (str): Output format (PNG, JPEG, etc.)
     
     Returns:
-        str: Base64 encoded image string
+        Image.Image: The same image, or an RGB copy for JPEG
+    
+    Note:
+        JPEG has no alpha channel or palette, so those modes are
+        converted to RGB first. Other formats are returned unchanged.
+    """
+    if format.upper() in ('JPEG', 'JPG') and image.mode not in ('RGB', 'L'):
+        return image.convert('RGB')
+    return image
+
+
+def image_to_bytes(
+    image: Image.Image,
+    format: str = 'PNG',
+    **save_options
+) -> bytes:
+    """
+    Encode PIL Image to file bytes.
+    
+    Responsibility: ONLY encode PIL Image to bytes in a file format
+    
+    Args:
+        image (Image.Image): PIL Image object
+        format (str): Output format (PNG, JPEG, etc.)
+        **save_options: Encoder options passed to Image.save (e.g. quality)
+    
+    Returns:
+        bytes: Encoded image file contents
     
     Example:
         >>> img = Image.new('RGB', (100, 100))
-        >>> b64 = image_to_base64(img)
-        >>> print(b64[:20])  # Shows start of base64 string
+        >>> data = image_to_bytes(img)
+        >>> print(data[:4])
+        b'\x89PNG'
     """
     # Create byte buffer to hold image data
     buffer = BytesIO()
     
     # Save image to buffer in specified format
     # This converts PIL Image to bytes
-    image.save(buffer, format=format)
+    image = _prepare_for_format(image, format)
+    image.save(buffer, format=format, **save_options)
     
-    # Get byte value from buffer
-    image_bytes = buffer.getvalue()
+    return buffer.getvalue()
+
+
+def image_to_base64(
+    image: Image.Image,
+    format: str = 'PNG',
+    **save_options
+) -> str:
+    """
+    Convert PIL Image to base64 string.
+    
+    Responsibility: ONLY convert PIL Image to base64 encoding
+    
+    Args:
+        image (Image.Image): PIL Image object
+        format (str): Output format (PNG, JPEG, etc.)
+        **save_options: Encoder options passed to Image.save (e.g. quality)
+    
+    Returns:
+        str: Base64 encoded image string
+    
+    Example:
+        >>> img = Image.new('RGB', (100, 100))
+        >>> b64 = image_to_base64(img)
+        >>> print(b64[:20])  # Shows start of base64 string
+    """
+    buffer = BytesIO()
+    image = _prepare_for_format(image, format)
+    image.save(buffer, format=format, **save_options)
     
     # Encode bytes to base64 string
     # This makes it safe for JSON transmission
-    base64_string = base64.b64encode(image_bytes).decode('utf-8')
+    # getbuffer() exposes the encoded file without copying it to bytes
+    with buffer.getbuffer() as image_bytes:
+        base64_string = b64encode_as_string(image_bytes)
     
     return base64_string
 
 
-def base64_to_image(base64_string: str) -> Image.Image:
+# Common format names that differ from PIL's decoder names
+_FORMAT_ALIASES = {'JPG': 'JPEG', 'TIF': 'TIFF'}
+
+
+@lru_cache(maxsize=32)
+def _decoder_format(format_hint: str) -> Optional[str]:
+    """
+    Map a format hint to the name of a registered PIL decoder.
+    
+    Responsibility: ONLY resolve a hint to a PIL format name
+    
+    Args:
+        format_hint (str): Format name, any case ('png', 'jpg', ...)
+    
+    Returns:
+        Optional[str]: PIL format name, or None if PIL has no such format
+    """
+    name = format_hint.upper()
+    name = _FORMAT_ALIASES.get(name, name)
+    
+    if name in Image.registered_extensions().values():
+        return name
+    return None
+
+
+def base64_to_image(
+    base64_string: str,
+    format_hint: Optional[str] = None
+) -> Image.Image:
     """
     Convert base64 string to PIL Image.
     
@@ -62,6 +162,10 @@ def base64_to_image(base64_string: str) -> Image.Image:
     
     Args:
         base64_string (str): Base64 encoded image string
+        format_hint (Optional[str]): Expected format ('PNG', 'JPEG', ...),
+            e.g. from a data URL prefix. Limits PIL to that decoder
+            instead of trying every registered format. Aliases such as
+            'jpg' are accepted; unknown hints fall back to detection.
     
     Returns:
         Image.Image: PIL Image object
@@ -77,13 +181,18 @@ def base64_to_image(base64_string: str) -> Image.Image:
     """
     try:
         # Decode base64 string to bytes
-        image_bytes = base64.b64decode(base64_string)
+        # (validate=False skips the strict alphabet check, as before)
+        image_bytes = b64decode(base64_string, validate=False)
         
         # Create byte buffer from decoded bytes
         buffer = BytesIO(image_bytes)
         
-        # Open image from buffer
-        image = Image.open(buffer)
+        # Open image from buffer, skipping format detection if we know it
+        decoder = _decoder_format(format_hint) if format_hint else None
+        if decoder:
+            image = Image.open(buffer, formats=(decoder,))
+        else:
+            image = Image.open(buffer)
         
         return image
     
@@ -124,6 +233,47 @@ def resize_image(
         return image.resize((width, height), Image.Resampling.LANCZOS)
 
 
+# Bytes per pixel of the raw pixel data for each image mode
+# Modes not listed use one byte per band
+_BYTES_PER_PIXEL = {
+    'I': 4,
+    'F': 4,
+    'I;16': 2,
+    'I;16L': 2,
+    'I;16B': 2,
+    'I;16N': 2
+}
+
+
+def _raw_size_bytes(image: Image.Image) -> int:
+    """
+    Calculate the size of an image's raw pixel data.
+    
+    Responsibility: ONLY compute the raw data size from size and mode
+    
+    Args:
+        image (Image.Image): PIL Image object
+    
+    Returns:
+        int: Same value as len(image.tobytes()), without copying pixels
+    
+    Note:
+        Mode '1' packs 8 pixels per byte, with each row padded
+        to a whole byte.
+    """
+    width, height = image.size
+    mode = image.mode
+    
+    if mode == '1':
+        return ((width + 7) // 8) * height
+    
+    bytes_per_pixel = _BYTES_PER_PIXEL.get(mode)
+    if bytes_per_pixel is None:
+        bytes_per_pixel = len(image.getbands())
+    
+    return width * height * bytes_per_pixel
+
+
 def get_image_info(image: Image.Image) -> dict:
     """
     Extract image metadata and information.
@@ -147,13 +297,14 @@ def get_image_info(image: Image.Image) -> dict:
         'height': image.height,
         'format': image.format if image.format else 'Unknown',
         'mode': image.mode,
-        'size_bytes': len(image.tobytes())
+        'size_bytes': _raw_size_bytes(image)
     }
 
 
 def create_thumbnail(
     image: Image.Image,
-    max_size: int = 200
+    max_size: int = 200,
+    copy: bool = True
 ) -> Image.Image:
     """
     Create thumbnail version of image.
@@ -163,18 +314,23 @@ def create_thumbnail(
     Args:
         image (Image.Image): Original image
         max_size (int): Maximum dimension for thumbnail
+        copy (bool): Copy the image first so the original is untouched.
+            Pass False when the original is no longer needed, to skip
+            allocating a second full-size pixel buffer.
     
     Returns:
-        Image.Image: Thumbnail image
+        Image.Image: Thumbnail image (the same object when copy=False)
     
     Note:
         Maintains aspect ratio, fits within max_size x max_size
     """
-    # Create copy to avoid modifying original
-    thumbnail = image.copy()
+    # Copy unless the caller is done with the original
+    thumbnail = image.copy() if copy else image
     
     # Create thumbnail (modifies in place)
-    thumbnail.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    # Bilinear is plenty at thumbnail size and much cheaper than Lanczos
+    # (2x2 taps per output pixel instead of 6x6); resize_image keeps Lanczos
+    thumbnail.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
     
     return thumbnail
 
@@ -202,6 +358,14 @@ def ensure_rgb_mode(image: Image.Image) -> Image.Image:
     return image
 
 
+# Encoded sizes already measured, as {id(image): {key: size_bytes}}
+# where key is (format, size, mode). PIL images are unhashable, so entries
+# are keyed by id() and removed by a weakref finalizer when the image is
+# garbage collected. Size and mode are part of the key because images can
+# be resized in place (create_thumbnail(copy=False), resize_image).
+_file_size_cache: Dict[int, Dict[Tuple, int]] = {}
+
+
 def calculate_file_size_mb(image: Image.Image, format: str = 'PNG') -> float:
     """
     Calculate approximate file size in megabytes.
@@ -219,15 +383,27 @@ def calculate_file_size_mb(image: Image.Image, format: str = 'PNG') -> float:
         >>> img = Image.new('RGB', (1024, 1024))
         >>> size = calculate_file_size_mb(img)
         >>> print(f"{size:.2f} MB")
+    
+    Note:
+        The size is remembered per image object, format, dimensions and
+        mode, so repeat calls skip the encode. Edits that keep all of
+        these (e.g. paste()) are not detected.
     """
-    # Create temporary buffer
-    buffer = BytesIO()
+    image_id = id(image)
+    sizes = _file_size_cache.get(image_id)
     
-    # Save to buffer to get actual size
-    image.save(buffer, format=format)
+    if sizes is None:
+        sizes = _file_size_cache[image_id] = {}
+        weakref.finalize(image, _file_size_cache.pop, image_id, None)
     
-    # Get size in bytes
-    size_bytes = len(buffer.getvalue())
+    key = (format, image.size, image.mode)
+    size_bytes = sizes.get(key)
+    
+    if size_bytes is None:
+        # Save to buffer to get actual size
+        buffer = BytesIO()
+        image.save(buffer, format=format)
+        size_bytes = sizes[key] = buffer.getbuffer().nbytes
     
     # Convert to megabytes
     size_mb = size_bytes / (1024 * 1024)
@@ -235,31 +411,52 @@ def calculate_file_size_mb(image: Image.Image, format: str = 'PNG') -> float:
     return size_mb
 
 
-def pad_to_multiple_of_8(width: int, height: int) -> tuple[int, int]:
+@lru_cache(maxsize=256)
+def _pad_ints_to_multiple_of_8(width: int, height: int) -> tuple[int, int]:
     """
-    Pad dimensions to nearest multiple of 8.
+    Pad integer dimensions to the nearest multiple of 8.
     
-    Responsibility: ONLY calculate padded dimensions
+    Responsibility: ONLY compute (and cache) padded integer dimensions
     
     Args:
         width (int): Original width
         height (int): Original height
     
+    Returns:
+        tuple[int, int]: Padded (width, height)
+    """
+    # Round up to nearest multiple of 8
+    # Adding 7 then clearing the low three bits (& ~7) rounds up
+    return (width + 7) & ~7, (height + 7) & ~7
+
+
+def pad_to_multiple_of_8(
+    width: Union[int, float],
+    height: Union[int, float]
+) -> tuple[int, int]:
+    """
+    Pad dimensions to nearest multiple of 8.
+    
+    Responsibility: ONLY calculate padded dimensions
+    
+    Args:
+        width (Union[int, float]): Original width
+        height (Union[int, float]): Original height
+    
     Returns:
         tuple[int, int]: Padded (width, height)
     
     Note:
-        Most diffusion models require dimensions divisible by 8
+        Most diffusion models require dimensions divisible by 8.
+        Inputs are converted with int() (floats are truncated) before
+        padding, so float sizes work and share cache entries with ints.
+        Results are memoized, since only a few sizes are ever used.
     
     Example:
         >>> pad_to_multiple_of_8(765, 770)
         (768, 776)
     """
-    # Round up to nearest multiple of 8
-    padded_width = ((width + 7) // 8) * 8
-    padded_height = ((height + 7) // 8) * 8
-    
-    return padded_width, padded_height
+    return _pad_ints_to_multiple_of_8(int(width), int(height))
 
 
 def image_data_url(image: Image.Image, format: str = 'PNG') -> str: